@@ -16,10 +16,11 @@ def main():
     parser = argparse.ArgumentParser(description="Adaptive Policy Retraining Pipeline")
     parser.add_argument("--threshold", type=int, default=2000, help="New record threshold to trigger retraining")
     parser.add_argument("--force", action="store_true", help="Force retraining regardless of record count")
+    parser.add_argument("--export-booster", action="store_true", help="Also export the raw XGBoost booster (.json) next to each model")
     
     args = parser.parse_args()
 
-    pipeline = AdaptivePipeline(threshold=args.threshold)
+    pipeline = AdaptivePipeline(threshold=args.threshold, export_booster=args.export_booster)
     
     if args.force:
         logger.info("Forcing update as requested...")
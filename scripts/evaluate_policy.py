@@ -2,11 +2,11 @@
 import os
 import sys
 import logging
-import pandas as pd
 
 # Add project root to path
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
+from src.ml.dataset_builder import split_path, read_split
 from src.ml.evaluator import PolicyEvaluator
 
 logging.basicConfig(level=logging.INFO, format='%(levelname)s:%(name)s:%(message)s')
@@ -14,7 +14,7 @@ logger = logging.getLogger("EvaluatePolicy")
 
 def main():
     data_dir = "data"
-    test_path = os.path.join(data_dir, "test.csv")
+    test_path = split_path(data_dir, "test")
     model_path = "models/policy_model_v1.pkl"
     report_path = "reports/policy_model_v1_report.json"
 
@@ -26,7 +26,7 @@ def main():
         return
 
     logger.info("Loading test dataset...")
-    test_df = pd.read_csv(test_path)
+    test_df = read_split(test_path)
 
     try:
         evaluator = PolicyEvaluator(model_path)
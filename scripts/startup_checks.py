@@ -39,7 +39,10 @@ def run_startup_checks() -> bool:
     print("📝 Decision Audit:")
     from src.monitoring.decision_audit import get_auditor
     auditor = get_auditor()
-    print(f"   ✅ Decision audit logging to: {auditor.log_path}")
+    if auditor.log_path:
+        print(f"   ✅ Decision audit logging to: {auditor.log_path}")
+    else:
+        print("   ⏸️ Decision audit disabled (DECISION_AUDIT_ENABLED=false)")
     print()
     
     print("="*60)
@@ -2,20 +2,21 @@
 import os
 import sys
 import logging
-import pandas as pd
+from joblib import Parallel, delayed
 
 # Add project root to path
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
+from src.ml.dataset_builder import split_path, read_split
 from src.ml.trainer import PolicyTrainer
 
 logging.basicConfig(level=logging.INFO, format='%(levelname)s:%(name)s:%(message)s')
 logger = logging.getLogger("TrainEnsemble")
 
-def train_specialized_model(regime_suffix, model_type="xgboost", optimize=False):
+def train_specialized_model(regime_suffix, model_type="xgboost", optimize=False, n_jobs=None):
     data_dir = "data"
-    train_path = os.path.join(data_dir, f"train_{regime_suffix}.csv")
-    val_path = os.path.join(data_dir, f"val_{regime_suffix}.csv")
+    train_path = split_path(data_dir, f"train_{regime_suffix}")
+    val_path = split_path(data_dir, f"val_{regime_suffix}")
     model_path = f"models/policy_{regime_suffix}.pkl"
 
     if not os.path.exists(train_path) or not os.path.exists(val_path):
@@ -23,14 +24,15 @@ def train_specialized_model(regime_suffix, model_type="xgboost", optimize=False)
         return None
 
     logger.info(f"Loading {regime_suffix} datasets...")
-    train_df = pd.read_csv(train_path)
-    val_df = pd.read_csv(val_path)
+    train_df = read_split(train_path)
+    val_df = read_split(val_path)
 
-    trainer = PolicyTrainer(model_type=model_type)
+    trainer = PolicyTrainer(model_type=model_type, n_jobs=n_jobs)
     
     if optimize:
         logger.info(f"Optimizing Hyper-parameters for {model_type.upper()} ({regime_suffix.upper()})...")
-        trainer.optimize(train_df, val_df, n_trials=30)
+        # Experts optimize side by side: keep each study within its share of the cores
+        trainer.optimize(train_df, val_df, n_trials=30, n_parallel_trials=n_jobs)
         
     logger.info(f"Training specialized {model_type.upper()} model for {regime_suffix.upper()}...")
     metrics = trainer.train(train_df, val_df)
@@ -53,8 +55,13 @@ def main():
     regimes = ["bull", "bear", "sideways"]
     ensemble_metrics = {}
     
-    for r in regimes:
-        m = train_specialized_model(r, model_type=args.model_type, optimize=args.optimize)
+    # Experts are independent: train them side by side, splitting the cores between them
+    threads_per_expert = max(1, (os.cpu_count() or 1) // len(regimes))
+    results = Parallel(n_jobs=len(regimes), backend="loky")(
+        delayed(train_specialized_model)(r, model_type=args.model_type, optimize=args.optimize, n_jobs=threads_per_expert)
+        for r in regimes
+    )
+    for r, m in zip(regimes, results):
         if m:
             ensemble_metrics[r] = m
             
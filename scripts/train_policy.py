@@ -2,11 +2,11 @@
 import os
 import sys
 import logging
-import pandas as pd
 
 # Add project root to path
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
+from src.ml.dataset_builder import split_path, read_split
 from src.ml.trainer import PolicyTrainer
 
 logging.basicConfig(level=logging.INFO, format='%(levelname)s:%(name)s:%(message)s')
@@ -14,8 +14,8 @@ logger = logging.getLogger("TrainPolicy")
 
 def main():
     data_dir = "data"
-    train_path = os.path.join(data_dir, "train.csv")
-    val_path = os.path.join(data_dir, "validation.csv")
+    train_path = split_path(data_dir, "train")
+    val_path = split_path(data_dir, "validation")
     model_path = "models/policy_model_v1.pkl"
 
     if not os.path.exists(train_path) or not os.path.exists(val_path):
@@ -23,8 +23,8 @@ def main():
         return
 
     logger.info("Loading datasets...")
-    train_df = pd.read_csv(train_path)
-    val_df = pd.read_csv(val_path)
+    train_df = read_split(train_path)
+    val_df = read_split(val_path)
 
     trainer = PolicyTrainer()
     
@@ -8,6 +8,7 @@ from sklearn.metrics import roc_auc_score, accuracy_score
 # Add project root to path
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
+from src.ml.dataset_builder import read_split
 from src.ml.trainer import PolicyTrainer
 
 logging.basicConfig(level=logging.INFO, format='%(levelname)s:%(name)s:%(message)s')
@@ -77,7 +78,7 @@ def main():
         logger.error(f"Dataset not found: {args.data}")
         return
 
-    df = pd.read_csv(args.data)
+    df = read_split(args.data)
     results = walk_forward(
         df,
         train_window=args.train_window,
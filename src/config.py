@@ -105,6 +105,10 @@ class Config:
     DRIFT_WINDOW = int(os.getenv("DRIFT_WINDOW", "200"))
     DRIFT_ALERT_Z = float(os.getenv("DRIFT_ALERT_Z", "3.0"))
 
+    # Decision audit
+    DECISION_AUDIT_ENABLED = os.getenv("DECISION_AUDIT_ENABLED", "true").lower() == "true"
+    DECISION_AUDIT_SAMPLE_RATE = float(os.getenv("DECISION_AUDIT_SAMPLE_RATE", "1.0"))  # fraction of decisions audited
+
     # Strategy signal thresholds
     MIN_SIGNAL_SCORE = float(os.getenv("MIN_SIGNAL_SCORE", _profile_default("MIN_SIGNAL_SCORE", "0.60")))
     ML_CONFIDENCE_MIN = float(os.getenv("ML_CONFIDENCE_MIN", _profile_default("ML_CONFIDENCE_MIN", "0.65")))
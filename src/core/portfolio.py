@@ -17,6 +17,7 @@ class Portfolio:
         self._equity_peak = initial_balance
         self._daily_equity_start = initial_balance
         self._daily_date = datetime.now(UTC).date()
+        self.refresh_limits()
         
         # Phase 2: Cooldown tracking
         self.last_entry_times: Dict[str, datetime] = {}  # symbol -> last entry time
@@ -32,6 +33,24 @@ class Portfolio:
             self.trade_history: List[Dict[str, Any]] = []
             logger.info(f"Portfolio Initialized FRESH with ${initial_balance:,.2f}")
     
+    def reset(self, balance: float):
+        """Return to a fresh, empty portfolio with the given balance, reusing the existing containers."""
+        self.initial_capital = balance
+        self.balance = balance
+        self.equity = balance
+        self._equity_peak = balance
+        self._daily_equity_start = balance
+        self._daily_date = datetime.now(UTC).date()
+        self.active_positions.clear()
+        self.trade_history.clear()
+        self.last_entry_times.clear()
+        self.refresh_limits()
+
+    def refresh_limits(self):
+        """Re-read position limits from Config (cached on the instance for the open/can_open hot path)."""
+        self._max_per_symbol = Config.MAX_POSITIONS_PER_SYMBOL
+        self._max_concurrent = Config.MAX_CONCURRENT_POSITIONS
+
     def count_positions_for_symbol(self, symbol: str) -> int:
         """Count how many positions we have for a given symbol."""
         if symbol not in self.active_positions:
@@ -60,8 +79,8 @@ class Portfolio:
         """
         # Check max positions per symbol
         current_count = self.count_positions_for_symbol(symbol)
-        if current_count >= Config.MAX_POSITIONS_PER_SYMBOL:
-            return False, f"Max {Config.MAX_POSITIONS_PER_SYMBOL} positions per symbol"
+        if current_count >= self._max_per_symbol:
+            return False, f"Max {self._max_per_symbol} positions per symbol"
         
         # Check cooldown
         if symbol in self.last_entry_times:
@@ -72,8 +91,8 @@ class Portfolio:
         
         # Check total concurrent positions
         total_positions = sum(self.count_positions_for_symbol(s) for s in self.active_positions)
-        if total_positions >= Config.MAX_CONCURRENT_POSITIONS:
-            return False, f"Max {Config.MAX_CONCURRENT_POSITIONS} total positions"
+        if total_positions >= self._max_concurrent:
+            return False, f"Max {self._max_concurrent} total positions"
         
         return True, "OK"
     
@@ -137,8 +156,8 @@ class Portfolio:
         current_positions = self.active_positions.get(symbol, [])
         if not isinstance(current_positions, list):
             current_positions = [current_positions]
-        if len(current_positions) >= Config.MAX_POSITIONS_PER_SYMBOL:
-            logger.warning(f"Cannot open {symbol}: Max {Config.MAX_POSITIONS_PER_SYMBOL} positions reached.")
+        if len(current_positions) >= self._max_per_symbol:
+            logger.warning(f"Cannot open {symbol}: Max {self._max_per_symbol} positions reached.")
             return False
 
         # Apply Entry Fee and lock margin
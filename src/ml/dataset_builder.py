@@ -4,10 +4,49 @@ import csv
 import os
 import logging
 from typing import List, Dict, Any, Optional
+import pandas as pd
 from src.core.definitions import MarketRegime, VolatilityLevel, TrendStrength, StrategyType
+from src.ml.jsonl import parse_json_line
 
 logger = logging.getLogger(__name__)
 
+try:
+    import pyarrow  # noqa: F401  (multi-threaded CSV parser + Parquet for pandas)
+    CSV_ENGINE = "pyarrow"
+    PARQUET_ENGINE = "pyarrow"
+except ImportError:
+    CSV_ENGINE = "c"
+    try:
+        import fastparquet  # noqa: F401
+        PARQUET_ENGINE = "fastparquet"
+    except ImportError:
+        PARQUET_ENGINE = None
+
+SPLIT_COLUMNS = [
+    "market_regime", "volatility_level", "trend_strength",
+    "dist_to_high", "dist_to_low", "macd", "macd_signal", "macd_hist",
+    "bb_upper", "bb_lower", "bb_mid", "atr", "volume_delta",
+    "spread_pct", "body_pct", "gap_pct", "volume_zscore", "liquidity_proxy",
+    "htf_trend_spread", "htf_rsi", "htf_atr",
+    "trading_session", "symbol", "repeats", "current_open_positions",
+    "action_taken", "regime_confidence", "regime_stable",
+    "momentum_shift_score", "decision_quality"
+]
+
+
+def split_path(data_dir: str, name: str) -> str:
+    """Path of a split written by DatasetBuilder: Parquet if present, else CSV."""
+    parquet = os.path.join(data_dir, f"{name}.parquet")
+    return parquet if os.path.exists(parquet) else os.path.join(data_dir, f"{name}.csv")
+
+
+def read_split(path: str, columns: Optional[List[str]] = None) -> pd.DataFrame:
+    """Reads a dataset split (Parquet or CSV), loading only the requested columns."""
+    if path.endswith(".parquet"):
+        return pd.read_parquet(path, columns=columns, engine=PARQUET_ENGINE)
+    return pd.read_csv(path, usecols=columns, engine=CSV_ENGINE)
+
+
 class DatasetBuilder:
     FEATURE_MAPS_PATH = os.path.join("models", "feature_maps.json")
 
@@ -56,15 +95,14 @@ class DatasetBuilder:
         val_end = train_end + int(total * 0.15)
 
         splits = {
-            "train.csv": transformed_rows[:train_end],
-            "validation.csv": transformed_rows[train_end:val_end],
-            "test.csv": transformed_rows[val_end:]
+            "train": transformed_rows[:train_end],
+            "validation": transformed_rows[train_end:val_end],
+            "test": transformed_rows[val_end:]
         }
 
-        for fname, rows in splits.items():
-            fpath = os.path.join(data_dir, fname)
-            self._write_csv(fpath, rows)
-            logger.info(f"Split Created: {fname} with {len(rows)} rows.")
+        for name, rows in splits.items():
+            fpath = self._write_split(data_dir, name, rows)
+            logger.info(f"Split Created: {os.path.basename(fpath)} with {len(rows)} rows.")
 
     def build_regime_splits(self, transformed_rows: List[List[Any]], data_dir: str):
         """
@@ -95,27 +133,32 @@ class DatasetBuilder:
             total = len(rows)
             train_end = int(total * 0.80) # 80/20 split for specialized models
 
-            train_path = os.path.join(data_dir, f"train_{suffix}.csv")
-            val_path = os.path.join(data_dir, f"val_{suffix}.csv")
-
-            self._write_csv(train_path, rows[:train_end])
-            self._write_csv(val_path, rows[train_end:])
+            self._write_split(data_dir, f"train_{suffix}", rows[:train_end])
+            self._write_split(data_dir, f"val_{suffix}", rows[train_end:])
             logger.info(f"Regime Splits Created: {suffix} (Train: {train_end}, Val: {total-train_end})")
 
+    def _write_split(self, data_dir: str, name: str, rows: List[List[Any]]) -> str:
+        """
+        Writes a split as Parquet (snappy) when an engine is installed, CSV otherwise.
+        The other format's file is removed so split_path never picks up a stale copy.
+        """
+        if PARQUET_ENGINE:
+            path, stale = (os.path.join(data_dir, f"{name}.{ext}") for ext in ("parquet", "csv"))
+            df = pd.DataFrame(rows, columns=SPLIT_COLUMNS)
+            df.to_parquet(path, engine=PARQUET_ENGINE, compression="snappy", index=False)
+        else:
+            path, stale = (os.path.join(data_dir, f"{name}.{ext}") for ext in ("csv", "parquet"))
+            self._write_csv(path, rows)
+        try:
+            os.remove(stale)
+        except FileNotFoundError:
+            pass
+        return path
+
     def _write_csv(self, path: str, rows: List[List[Any]]):
         with open(path, "w", newline="", encoding="utf-8") as f:
             writer = csv.writer(f)
-            header = [
-                "market_regime", "volatility_level", "trend_strength",
-                "dist_to_high", "dist_to_low", "macd", "macd_signal", "macd_hist",
-                "bb_upper", "bb_lower", "bb_mid", "atr", "volume_delta",
-                "spread_pct", "body_pct", "gap_pct", "volume_zscore", "liquidity_proxy",
-                "htf_trend_spread", "htf_rsi", "htf_atr",
-                "trading_session", "symbol", "repeats", "current_open_positions",
-                "action_taken", "regime_confidence", "regime_stable",
-                "momentum_shift_score", "decision_quality"
-            ]
-            writer.writerow(header)
+            writer.writerow(SPLIT_COLUMNS)
             writer.writerows(rows)
 
     def _load_and_clean(self, path: str) -> List[Dict[str, Any]]:
@@ -126,17 +169,18 @@ class DatasetBuilder:
         if not os.path.exists(path):
             return []
             
-        with open(path, "r", encoding="utf-8") as f:
+        with open(path, "rb") as f:
             for line in f:
                 try:
-                    rec = json.loads(line)
+                    rec = parse_json_line(line)
                     if rec.get("resolved") is True:
                         # Extract sortable key (raw_timestamp is ISO string from DataFeeder)
                         # Metadata timestamp is also ISO format.
                         sort_key = rec.get("market_state", {}).get("raw_timestamp") or rec.get("timestamp")
                         rec["_sort_key"] = sort_key
                         valid_records.append(rec)
-                except:
+                except (ValueError, AttributeError):
+                    # Malformed line or non-object JSON
                     continue
         
         # Sort by timestamp
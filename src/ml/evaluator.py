@@ -1,19 +1,48 @@
 
 import logging
+import numpy as np
 import pandas as pd
 import xgboost as xgb
-from sklearn.metrics import accuracy_score, roc_auc_score, confusion_matrix
+from sklearn.metrics import roc_auc_score
 import joblib
 import os
 import json
+import math
+from typing import List, Optional
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 logger = logging.getLogger(__name__)
 
+
+def _json_default(obj):
+    """numpy scalars/arrays in the report: json can't encode them natively."""
+    if hasattr(obj, "tolist"):
+        return obj.tolist()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _finite_or_none(obj):
+    """NaN/inf metrics (e.g. AUC on a single-class test split) become null on both encoder paths."""
+    if isinstance(obj, dict):
+        return {k: _finite_or_none(v) for k, v in obj.items()}
+    if isinstance(obj, (list, tuple, np.ndarray)):
+        return [_finite_or_none(v) for v in obj]
+    if isinstance(obj, (float, np.floating)) and not math.isfinite(obj):
+        return None
+    return obj
+
 class PolicyEvaluator:
-    def __init__(self, model_path: str):
-        if not os.path.exists(model_path):
-            raise FileNotFoundError(f"Model file not found: {model_path}")
-        data = joblib.load(model_path)
+    PREDICT_CHUNK_ROWS = 50_000
+
+    def __init__(self, model_path: Optional[str] = None, model=None, feature_cols: Optional[List[str]] = None):
+        """
+        Loads the model from model_path, or takes an already-trained in-memory model
+        (e.g. PolicyTrainer.model) to skip the save/reload round trip.
+        """
         self.feature_cols = [
             "market_regime", "volatility_level", "trend_strength",
             "dist_to_high", "dist_to_low",
@@ -24,6 +53,21 @@ class PolicyEvaluator:
             "trading_session", "symbol", "repeats", "current_open_positions",
             "action_taken"
         ]
+        self.target_col = "decision_quality"
+
+        if model is not None:
+            self.model = model
+            if feature_cols is not None:
+                self.feature_cols = list(feature_cols)
+            elif hasattr(model, "feature_names_in_"):
+                self.feature_cols = list(model.feature_names_in_)
+            return
+
+        if model_path is None:
+            raise ValueError("PolicyEvaluator needs a model_path or a model")
+        if not os.path.exists(model_path):
+            raise FileNotFoundError(f"Model file not found: {model_path}")
+        data = joblib.load(model_path)
         if isinstance(data, dict) and "model" in data:
             self.model = data["model"]
             if isinstance(data.get("feature_cols"), list):
@@ -32,7 +76,11 @@ class PolicyEvaluator:
             self.model = data
             if hasattr(self.model, "feature_names_in_"):
                 self.feature_cols = list(self.model.feature_names_in_)
-        self.target_col = "decision_quality"
+
+        # Trainers may cap threads (e.g. parallel expert training); scoring gets every core.
+        # Only for our own loaded copy: an in-memory model may be shared with its trainer.
+        if hasattr(self.model, "get_params") and "n_jobs" in self.model.get_params():
+            self.model.set_params(n_jobs=os.cpu_count())
 
     def evaluate(self, test_df: pd.DataFrame) -> dict:
         """
@@ -43,16 +91,19 @@ class PolicyEvaluator:
 
         logger.info(f"Evaluating model on {len(X_test)} rows...")
 
-        # Predictions
-        preds = self.model.predict(X_test)
-        probs = self.model.predict_proba(X_test)[:, 1]
+        # Predictions: one predict_proba pass, class labels derived by thresholding
+        # (same 0.5 cut XGBoost/LightGBM use in predict)
+        probs = self._predict_proba(X_test)
+        preds = probs > 0.5
+        y = y_test.to_numpy().astype(bool)
 
-        # Basic Metrics
-        acc = accuracy_score(y_test, preds)
-        auc = roc_auc_score(y_test, probs)
-        
-        # Confusion Matrix
-        tn, fp, fn, tp = confusion_matrix(y_test, preds).ravel()
+        # Confusion Matrix + accuracy from boolean counts
+        tp = int(np.count_nonzero(preds & y))
+        fp = int(np.count_nonzero(preds & ~y))
+        fn = int(np.count_nonzero(~preds & y))
+        tn = len(y) - tp - fp - fn
+        acc = (tp + tn) / len(y)
+        auc = roc_auc_score(y, probs)
 
         # Feature Importance - handle both XGBoost and LightGBM
         importance = {}
@@ -64,7 +115,11 @@ class PolicyEvaluator:
             for i, imp in enumerate(self.model.feature_importances_):
                 col_name = self.feature_cols[i] if i < len(self.feature_cols) else f"f{i}"
                 importance[col_name] = float(imp)
-        sorted_importance = sorted(importance.items(), key=lambda x: x[1], reverse=True)
+
+        # Descending by importance; stable so ties keep feature order like sorted(reverse=True)
+        names = list(importance)
+        vals = np.fromiter(importance.values(), dtype=np.float64, count=len(importance))
+        order = np.argsort(-vals, kind="stable")
 
         report = {
             "metrics": {
@@ -77,16 +132,33 @@ class PolicyEvaluator:
                     "tp": int(tp)
                 }
             },
-            "feature_importance": {name: float(val) for name, val in sorted_importance}
+            "feature_importance": dict(zip([names[i] for i in order], vals[order].tolist()))
         }
 
         return report
 
+    def _predict_proba(self, X: pd.DataFrame) -> np.ndarray:
+        """P(class 1), scored in row chunks so each block's features stay cache-resident."""
+        step = self.PREDICT_CHUNK_ROWS
+        if len(X) <= step:
+            return self.model.predict_proba(X)[:, 1]
+        return np.concatenate([
+            self.model.predict_proba(X.iloc[i:i + step])[:, 1]
+            for i in range(0, len(X), step)
+        ])
+
     def save_report(self, report: dict, path: str):
         """
         Saves the evaluation report to a JSON file.
         """
         os.makedirs(os.path.dirname(path), exist_ok=True)
-        with open(path, "w", encoding="utf-8") as f:
-            json.dump(report, f, indent=4)
+        report = _finite_or_none(report)
+        if orjson is not None:
+            payload = orjson.dumps(report, default=_json_default,
+                                   option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY)
+            with open(path, "wb") as f:  # orjson output is UTF-8
+                f.write(payload)
+        else:
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump(report, f, indent=2, ensure_ascii=False, default=_json_default)
         logger.info(f"Report saved to {path}")
@@ -1,5 +1,7 @@
 
 import logging
+import functools
+import numpy as np
 import pandas as pd
 import joblib
 import os
@@ -10,6 +12,28 @@ from src.ml.registry import ModelRegistry
 
 logger = logging.getLogger(__name__)
 
+BOOSTER_EXTENSIONS = (".json", ".ubj")
+
+
+@functools.lru_cache(maxsize=16)
+def _cached_load(path: str, mtime: float):
+    """Unpickle a model artifact once per process; mtime in the key invalidates on rewrite."""
+    if path.endswith(BOOSTER_EXTENSIONS):
+        # Native XGBoost export (see PolicyTrainer.export_booster): no sklearn/pickle layer
+        import xgboost as xgb
+        return xgb.Booster(model_file=path)
+    return joblib.load(path)
+
+
+def _load_artifact(path: str):
+    return _cached_load(path, os.path.getmtime(path))
+
+
+def _neutral_confidence(state: MarketState, action: Action, repeats: int = 0) -> float:
+    """predict_confidence stand-in when no model is loaded (shadow mode)."""
+    return 0.5
+
+
 class PolicyInference:
     FEATURE_MAPS_PATH = "models/feature_maps.json"
     FEATURE_COLS_BASE = [
@@ -36,10 +60,12 @@ class PolicyInference:
         self.ensemble_calibrators = {}
         
         # Consistent mappings from enums
-        self.regime_map = {e.value: i for i, e in enumerate(MarketRegime)}
-        self.vol_map = {e.value: i for i, e in enumerate(VolatilityLevel)}
-        self.trend_map = {e.value: i for i, e in enumerate(TrendStrength)}
-        self.strategy_map = {e.value: i for i, e in enumerate(StrategyType)}
+        # Keyed by enum member (same codes as DatasetBuilder's value-keyed maps):
+        # skips the Enum.value property lookup on every prediction
+        self.regime_map = {e: i for i, e in enumerate(MarketRegime)}
+        self.vol_map = {e: i for i, e in enumerate(VolatilityLevel)}
+        self.trend_map = {e: i for i, e in enumerate(TrendStrength)}
+        self.strategy_map = {e: i for i, e in enumerate(StrategyType)}
         
         # Load persistent maps (ensures training/inference consistency)
         self._load_feature_maps()
@@ -66,7 +92,7 @@ class PolicyInference:
         # 1. Main Model
         if self.model_path and os.path.exists(self.model_path):
             try:
-                data = joblib.load(self.model_path)
+                data = _load_artifact(self.model_path)
                 if isinstance(data, dict) and "model" in data:
                     self.model = data["model"]
                     if isinstance(data.get("feature_cols"), list):
@@ -88,7 +114,7 @@ class PolicyInference:
                     path = info.get("path")
                     if path and os.path.exists(path):
                         try:
-                            data = joblib.load(path)
+                            data = _load_artifact(path)
                             if isinstance(data, dict) and "model" in data:
                                 self.ensemble[regime] = data["model"]
                                 if isinstance(data.get("feature_cols"), list):
@@ -107,7 +133,7 @@ class PolicyInference:
                 path = f"models/policy_{r}.pkl"
                 if os.path.exists(path):
                     try:
-                        data = joblib.load(path)
+                        data = _load_artifact(path)
                         if isinstance(data, dict) and "model" in data:
                             self.ensemble[r] = data["model"]
                             if isinstance(data.get("feature_cols"), list):
@@ -121,6 +147,48 @@ class PolicyInference:
 
         if not self.model and not self.ensemble:
             logger.warning("PolicyInference: No models found. Shadow mode will return neutral scores.")
+            # Nothing to route to: skip feature mapping entirely on every call
+            self.predict_confidence = _neutral_confidence
+
+        # Column order and predict API are fixed per model: resolve them once instead of on every prediction
+        models = [m for m in (self.model, *self.ensemble.values()) if m is not None]
+        self._model_cols = {id(m): self._resolve_feature_cols(m) for m in models}
+        self._model_predict = {id(m): self._resolve_predictor(m, self._model_cols[id(m)]) for m in models}
+
+    def _resolve_feature_cols(self, model) -> tuple:
+        """Feature columns in the order the model was trained with."""
+        if hasattr(model, "feature_names_in_"):
+            return tuple(model.feature_names_in_)
+        if getattr(model, "feature_names", None):
+            # Raw xgb.Booster keeps the names it was trained with
+            return tuple(model.feature_names)
+        feature_cols = self.feature_cols or (self.FEATURE_COLS_BASE + self.FEATURE_COLS_EXTRA)
+        if hasattr(model, "n_features_in_"):
+            expected = int(model.n_features_in_)
+            if expected == len(self.FEATURE_COLS_BASE):
+                return tuple(self.FEATURE_COLS_BASE)
+            if expected == len(self.FEATURE_COLS_BASE) + len(self.FEATURE_COLS_EXTRA):
+                return tuple(self.FEATURE_COLS_BASE + self.FEATURE_COLS_EXTRA)
+            return tuple(feature_cols[:expected])
+        return tuple(feature_cols)
+
+    @staticmethod
+    def _resolve_predictor(model, feature_cols: tuple):
+        """Single-row P(class 1) function for the model's API, avoiding a per-call DataFrame."""
+        if hasattr(model, "inplace_predict"):
+            # Raw booster: predict straight from a float32 row, no DataFrame/DMatrix
+            return lambda row: float(model.inplace_predict(np.array([row], dtype=np.float32), predict_type="value")[0])
+        if hasattr(model, "get_booster"):
+            # XGBClassifier takes ndarrays without feature-name checks
+            return lambda row: float(model.predict_proba(np.array([row], dtype=np.float64))[0][1])
+        if hasattr(model, "booster_"):
+            # LGBMClassifier: the fitted booster returns P(class 1) for the binary objective
+            # and skips sklearn's feature-name validation (which warns on ndarrays)
+            booster = model.booster_
+            return lambda row: float(booster.predict(np.array([row], dtype=np.float64))[0])
+        columns = list(feature_cols)
+        # Class 1 = 'Good'
+        return lambda row: float(model.predict_proba(pd.DataFrame([row], columns=columns))[0][1])
 
     def predict_confidence(self, state: MarketState, action: Action, repeats: int = 0) -> float:
         """
@@ -130,15 +198,15 @@ class PolicyInference:
         # Select Model
         model = self.model
         calibrator = self.calibrator
-        regime_val = state.market_regime.value
+        regime = state.market_regime
         
-        if regime_val == MarketRegime.BULL_TREND.value:
+        if regime is MarketRegime.BULL_TREND:
             model = self.ensemble.get("bull", model)
             calibrator = self.ensemble_calibrators.get("bull", calibrator)
-        elif regime_val == MarketRegime.BEAR_TREND.value:
+        elif regime is MarketRegime.BEAR_TREND:
             model = self.ensemble.get("bear", model)
             calibrator = self.ensemble_calibrators.get("bear", calibrator)
-        elif regime_val == MarketRegime.SIDEWAYS_LOW_VOL.value:
+        elif regime is MarketRegime.SIDEWAYS_LOW_VOL:
             model = self.ensemble.get("sideways", model)
             calibrator = self.ensemble_calibrators.get("sideways", calibrator)
 
@@ -148,9 +216,9 @@ class PolicyInference:
         try:
             # 1. Map features exactly like DatasetBuilder
             features = {
-                "market_regime": self.regime_map.get(state.market_regime.value, -1),
-                "volatility_level": self.vol_map.get(state.volatility_level.value, -1),
-                "trend_strength": self.trend_map.get(state.trend_strength.value, -1),
+                "market_regime": self.regime_map.get(regime, -1),
+                "volatility_level": self.vol_map.get(state.volatility_level, -1),
+                "trend_strength": self.trend_map.get(state.trend_strength, -1),
                 "dist_to_high": state.dist_to_high,
                 "dist_to_low": state.dist_to_low,
                 
@@ -176,7 +244,7 @@ class PolicyInference:
                 "symbol": self.symbol_map.get(state.symbol, 0),
                 "repeats": repeats,
                 "current_open_positions": state.current_open_positions,
-                "action_taken": self.strategy_map.get(action.strategy.value, 0),
+                "action_taken": self.strategy_map.get(action.strategy, 0),
                 
                 # Phase C: Anticipatory Regime Detection
                 "regime_confidence": state.regime_confidence,
@@ -185,26 +253,18 @@ class PolicyInference:
             }
 
             # 2. Determine feature columns (align with model expectations)
-            feature_cols = list(self.feature_cols) if self.feature_cols else list(features.keys())
-            if hasattr(model, "feature_names_in_"):
-                feature_cols = list(model.feature_names_in_)
-            elif hasattr(model, "n_features_in_"):
-                expected = int(model.n_features_in_)
-                if expected == len(self.FEATURE_COLS_BASE):
-                    feature_cols = list(self.FEATURE_COLS_BASE)
-                elif expected == len(self.FEATURE_COLS_BASE) + len(self.FEATURE_COLS_EXTRA):
-                    feature_cols = list(self.FEATURE_COLS_BASE + self.FEATURE_COLS_EXTRA)
-                else:
-                    feature_cols = feature_cols[:expected]
+            feature_cols = self._model_cols.get(id(model))
+            if feature_cols is None:
+                feature_cols = self._model_cols[id(model)] = self._resolve_feature_cols(model)
+            predict = self._model_predict.get(id(model))
+            if predict is None:
+                predict = self._model_predict[id(model)] = self._resolve_predictor(model, feature_cols)
 
-            # 3. DataFrame for Model (ensure column order + defaults)
-            row = {k: features.get(k, 0.0) for k in feature_cols}
-            df = pd.DataFrame([row], columns=feature_cols)
-            
-            # 4. Predict Proba
-            # Both XGBoost and LightGBM follow sklearn's predict_proba
-            probs = model.predict_proba(df)[0]
-            confidence = float(probs[1]) # Class 1 = 'Good'
+            # 3. Single row in model column order (missing features default to 0.0)
+            row = [features.get(k, 0.0) for k in feature_cols]
+
+            # 4. Predict probability of class 1 ('Good')
+            confidence = predict(row)
 
             if calibrator is not None:
                 try:
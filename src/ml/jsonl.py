@@ -0,0 +1,24 @@
+"""
+JSONL parsing shared by the ML modules. Kept free of pandas/pyarrow so lightweight
+callers (staleness checks, the pipeline's resolved-record counter) stay cheap to import.
+"""
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def parse_json_line(line: bytes) -> Any:
+    """
+    Parses one JSONL line, orjson first. Falls back to stdlib json for the NaN/Infinity
+    tokens json.dumps emits (orjson rejects them). Raises ValueError on bad input.
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(line)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(line)
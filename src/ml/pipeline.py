@@ -1,26 +1,42 @@
 import logging
+import mmap
 import os
+import re
 import json
-import pandas as pd
+from concurrent.futures import ThreadPoolExecutor
 import joblib
 from typing import Optional, Dict, Any
 from src.ml.registry import ModelRegistry
-from src.ml.dataset_builder import DatasetBuilder
+from src.ml.dataset_builder import DatasetBuilder, read_split, split_path
+from src.ml.jsonl import parse_json_line
 from src.ml.trainer import PolicyTrainer
 from src.ml.evaluator import PolicyEvaluator
 
 logger = logging.getLogger(__name__)
 
+# Top-level `"resolved": true` as ExperienceDB writes it; a key inside a string value
+# would carry escaped quotes and never match
+_RESOLVED_TRUE = re.compile(rb'"resolved"\s*:\s*true\s*[,}]')
+# A line holding the key more than once (e.g. a nested dict) needs a real parse
+_MULTI_RESOLVED = re.compile(rb'"resolved"[^\n]*"resolved"')
+
 class AdaptivePipeline:
+    CHECKPOINT_TAIL_BYTES = 64
+
     def __init__(self, 
                  threshold: int = 100,  # Phase A: Lowered from 2000 for faster learning
                  data_log_path: str = "data/experience_log.jsonl",
-                 models_dir: str = "models"):
+                 models_dir: str = "models",
+                 export_booster: bool = False):
         self.threshold = threshold
         self.data_log_path = data_log_path
         self.models_dir = models_dir
+        # Also write each xgboost model's raw booster (.json) next to its .pkl
+        self.export_booster = export_booster
         self.registry = ModelRegistry()
         self.builder = DatasetBuilder()
+        # Sidecar scan checkpoint: kept out of the versioned registry.json
+        self._resolved_cache_path = data_log_path + ".count"
 
     def run_check(self) -> bool:
         """
@@ -30,15 +46,7 @@ class AdaptivePipeline:
         logger.info("Pipeline: Checking for new experience data...")
         
         # 1. Count resolved records in log
-        resolved_count = 0
-        if os.path.exists(self.data_log_path):
-            with open(self.data_log_path, "r", encoding="utf-8") as f:
-                for line in f:
-                    try:
-                        if json.loads(line).get("resolved") is True:
-                            resolved_count += 1
-                    except:
-                        continue
+        resolved_count = self._count_resolved()
         
         last_count = self.registry.get_last_trained_count()
         new_records = resolved_count - last_count
@@ -51,6 +59,92 @@ class AdaptivePipeline:
             
         return self._execute_update(resolved_count)
 
+    def _load_scan_checkpoint(self) -> Dict[str, Any]:
+        """
+        The sidecar is only a cache: anything unreadable or of the wrong shape yields
+        the empty checkpoint, which forces a full rescan instead of failing run_check.
+        """
+        empty = {"size": -1, "mtime_ns": 0, "offset": 0, "tail": "", "resolved_count": 0}
+        try:
+            with open(self._resolved_cache_path, "rb") as f:
+                ckpt = parse_json_line(f.read())
+            if not isinstance(ckpt, dict):
+                return empty
+            ints = [ckpt[k] for k in ("size", "mtime_ns", "offset", "resolved_count")]
+            if any(type(v) is not int for v in ints) or ckpt["offset"] < 0 or ckpt["resolved_count"] < 0:
+                return empty
+            bytes.fromhex(ckpt["tail"])
+        except (OSError, ValueError, KeyError, TypeError):
+            return empty
+        return ckpt
+
+    def _save_scan_checkpoint(self, checkpoint: Dict[str, Any]):
+        temp_path = self._resolved_cache_path + ".tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump(checkpoint, f)
+        os.replace(temp_path, self._resolved_cache_path)
+
+    def _count_resolved(self) -> int:
+        """
+        Counts resolved records, scanning only bytes appended since the last poll.
+        An unchanged (size, mtime) returns the cached count without opening the log.
+        ExperienceDB resolves records by rewriting the whole log, so the checkpoint
+        also keeps the bytes just before the saved offset: if they no longer match,
+        the prefix was rewritten and the log is rescanned from the start.
+        """
+        try:
+            st = os.stat(self.data_log_path)
+        except FileNotFoundError:
+            return 0
+
+        ckpt = self._load_scan_checkpoint()
+        if ckpt["size"] == st.st_size and ckpt["mtime_ns"] == st.st_mtime_ns:
+            return ckpt["resolved_count"]
+
+        offset, resolved_count = ckpt["offset"], ckpt["resolved_count"]
+        tail = bytes.fromhex(ckpt["tail"])
+
+        if st.st_size:
+            with open(self.data_log_path, "rb") as f, \
+                 mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                if len(mm) < offset or mm[max(0, offset - len(tail)):offset] != tail:
+                    offset, resolved_count, tail = 0, 0, b""
+                # Only complete lines; a trailing partial line is picked up next poll
+                end = mm.rfind(b"\n", offset) + 1
+                if end > offset:
+                    resolved_count += self._count_resolved_span(mm, offset, end)
+                    tail = mm[max(0, end - self.CHECKPOINT_TAIL_BYTES):end]
+                    offset = end
+        else:
+            offset, resolved_count, tail = 0, 0, b""
+
+        # size/mtime come from the stat taken before reading: a write racing the scan
+        # leaves them stale, so the next poll rescans from the saved offset
+        self._save_scan_checkpoint({
+            "size": st.st_size, "mtime_ns": st.st_mtime_ns,
+            "offset": offset, "tail": tail.hex(), "resolved_count": resolved_count
+        })
+        return resolved_count
+
+    @staticmethod
+    def _count_resolved_span(mm: mmap.mmap, start: int, end: int) -> int:
+        """
+        Counts resolved records in mm[start:end] (whole lines) with one C-level regex sweep.
+        The key appears once per record, so the regex settles it; lines carrying several
+        "resolved" keys (nested dicts) are corrected by parsing just those lines.
+        """
+        count = sum(1 for _ in _RESOLVED_TRUE.finditer(mm, start, end))
+        for m in _MULTI_RESOLVED.finditer(mm, start, end):
+            line_start = max(start, mm.rfind(b"\n", start, m.start()) + 1)
+            line_end = mm.find(b"\n", m.end(), end)
+            count -= sum(1 for _ in _RESOLVED_TRUE.finditer(mm, line_start, line_end))
+            try:
+                if parse_json_line(mm[line_start:line_end]).get("resolved") is True:
+                    count += 1
+            except (ValueError, AttributeError):
+                continue
+        return count
+
     def _execute_update(self, total_records: int) -> bool:
         logger.info("Pipeline: Threshold met. Starting Adaptive Update...")
         
@@ -69,19 +163,20 @@ class AdaptivePipeline:
         model_filename = f"policy_model_{next_ver}.pkl"
         model_path = os.path.join(self.models_dir, model_filename)
         
-        train_df = pd.read_csv(os.path.join(data_dir, "train.csv"))
-        val_df = pd.read_csv(os.path.join(data_dir, "validation.csv"))
-        test_df = pd.read_csv(os.path.join(data_dir, "test.csv"))
-        
-        import pandas as pd # Ensure pandas is available locally if needed, but it's likely global
-        
         trainer = PolicyTrainer()
+        columns = trainer.feature_cols + [trainer.target_col]
+        train_df = read_split(split_path(data_dir, "train"), columns)
+        val_df = read_split(split_path(data_dir, "validation"), columns)
+        test_df = read_split(split_path(data_dir, "test"), columns)
+        
         trainer.train(train_df, val_df)
-        trainer.save_model(model_path)
         
-        # 3. Evaluate New Model
-        evaluator = PolicyEvaluator(model_path)
-        new_report = evaluator.evaluate(test_df)
+        # 3. Evaluate New Model on the in-memory estimator while the artifact is written
+        evaluator = PolicyEvaluator(model=trainer.model, feature_cols=trainer.feature_cols)
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            saved = pool.submit(trainer.save_model, model_path, self.export_booster)
+            new_report = evaluator.evaluate(test_df)
+            saved.result()  # re-raise save errors before the model is registered
         new_auc = new_report["metrics"]["test_roc_auc"]
         
         # 4. Promotion Gate
@@ -90,13 +185,14 @@ class AdaptivePipeline:
         
         logger.info(f"Pipeline: New Model ({next_ver}) AUC: {new_auc:.4f} vs Current AUC: {current_auc:.4f}")
         
-        # Register the new model anyway (for history)
-        self.registry.register_model(next_ver, model_path, new_report["metrics"], total_records)
-        
-        if new_auc > current_auc:
-            logger.info(f"Pipeline: PROMOTION GRANTED. Updating active model to {next_ver}.")
-            self.registry.promote_model(next_ver, total_records)
-            return True
-        else:
-            logger.info("Pipeline: PROMOTION REJECTED. New model did not outperform current model.")
-            return False
+        # Register the new model anyway (for history); register + promote is one registry write
+        with self.registry.transaction():
+            self.registry.register_model(next_ver, model_path, new_report["metrics"], total_records)
+            
+            if new_auc > current_auc:
+                logger.info(f"Pipeline: PROMOTION GRANTED. Updating active model to {next_ver}.")
+                self.registry.promote_model(next_ver, total_records)
+                return True
+            else:
+                logger.info("Pipeline: PROMOTION REJECTED. New model did not outperform current model.")
+                return False
@@ -2,6 +2,7 @@
 import json
 import os
 import logging
+from contextlib import contextmanager
 from typing import Dict, Any, Optional
 from datetime import datetime, UTC
 
@@ -15,19 +16,62 @@ class ModelRegistry:
             "models": {},
             "total_records_at_last_train": 0
         }
+        self._txn_depth = 0
+        self._txn_failed = False
+        self._dirty = False
+        self._last_bytes = None
         self._load()
 
     def _load(self):
         if os.path.exists(self.registry_path):
-            with open(self.registry_path, "r", encoding="utf-8") as f:
-                self.data = json.load(f)
+            with open(self.registry_path, "rb") as f:
+                raw = f.read()
+            self.data = json.loads(raw)
+            self._last_bytes = raw
         else:
             self._save()
 
     def _save(self):
+        self._dirty = False
+        buf = json.dumps(self.data, indent=4).encode("utf-8")
+        if buf == self._last_bytes:
+            return  # Nothing changed on disk since the last load/save
         os.makedirs(os.path.dirname(self.registry_path), exist_ok=True)
-        with open(self.registry_path, "w", encoding="utf-8") as f:
-            json.dump(self.data, f, indent=4)
+        # Write-then-rename: a crash mid-write never leaves a torn registry.json
+        temp_path = self.registry_path + ".tmp"
+        with open(temp_path, "wb") as f:
+            f.write(buf)
+        os.replace(temp_path, self.registry_path)
+        self._last_bytes = buf
+
+    def _commit(self):
+        """Persists a mutation now, or at the end of the enclosing transaction()."""
+        self._dirty = True
+        if not self._txn_depth:
+            self._save()
+
+    def _rollback(self):
+        """Drops unsaved mutations: back to what is on disk."""
+        self._txn_failed = False
+        self._dirty = False
+        self.data = json.loads(self._last_bytes)
+
+    @contextmanager
+    def transaction(self):
+        """Batches several registry updates into a single write. An exception discards the whole batch."""
+        self._txn_depth += 1
+        try:
+            yield self
+        except BaseException:
+            self._txn_failed = True
+            raise
+        finally:
+            self._txn_depth -= 1
+            if not self._txn_depth:
+                if self._txn_failed:
+                    self._rollback()
+                elif self._dirty:
+                    self._save()
 
     def register_model(self, version: str, path: str, metrics: Dict[str, float], record_count: int):
         self.data["models"][version] = {
@@ -37,7 +81,7 @@ class ModelRegistry:
             "trained_at": datetime.now(UTC).isoformat(),
             "record_count": record_count
         }
-        self._save()
+        self._commit()
         logger.info(f"Registry: Registered model {version} with AUC: {metrics.get('test_roc_auc', 0):.4f}")
 
     def register_ensemble(self, version: str, specialized_models: Dict[str, Dict[str, Any]], record_count: int):
@@ -51,14 +95,14 @@ class ModelRegistry:
             "trained_at": datetime.now(UTC).isoformat(),
             "record_count": record_count
         }
-        self._save()
+        self._commit()
         logger.info(f"Registry: Registered ensemble version {version} with {len(specialized_models)} experts.")
 
     def promote_model(self, version: str, total_records: int):
         if version in self.data["models"]:
             self.data["active_version"] = version
             self.data["total_records_at_last_train"] = total_records
-            self._save()
+            self._commit()
             logger.info(f"Registry: Promoted model {version} to ACTIVE.")
         else:
             logger.error(f"Registry: Cannot promote unknown version {version}")
@@ -5,8 +5,9 @@ Detects when the trained model is missing features or outdated.
 import json
 import os
 import logging
-from typing import List, Set, Optional, Dict, Any
+from typing import List, FrozenSet, Optional, Dict, Any
 from datetime import datetime
+from src.ml.jsonl import parse_json_line
 
 logger = logging.getLogger(__name__)
 
@@ -35,29 +36,39 @@ class ModelStalenessChecker:
         "regime_confidence", "regime_stable", "momentum_shift_score",
         "funding_rate",
     ]
+    _CURRENT_FEATURES_FS = frozenset(CURRENT_FEATURES)
     
     def __init__(self, model_dir: str = "models"):
         self.model_dir = model_dir
         self.feature_maps_path = os.path.join(model_dir, "feature_maps.json")
+        self._trained_cache = None  # ((mtime_ns, size), frozenset)
     
-    def get_trained_features(self) -> Set[str]:
-        """Get features the current model was trained on."""
-        if not os.path.exists(self.feature_maps_path):
-            return set()
+    def get_trained_features(self) -> FrozenSet[str]:
+        """Get features the current model was trained on (re-read only when the file changes)."""
+        try:
+            st = os.stat(self.feature_maps_path)
+        except FileNotFoundError:
+            return frozenset()
+        
+        key = (st.st_mtime_ns, st.st_size)
+        if self._trained_cache is not None and self._trained_cache[0] == key:
+            return self._trained_cache[1]
         
         try:
-            with open(self.feature_maps_path, "r", encoding="utf-8") as f:
-                data = json.load(f)
-            return set(data.get("feature_columns", []))
-        except (json.JSONDecodeError, KeyError):
-            return set()
+            with open(self.feature_maps_path, "rb") as f:
+                data = parse_json_line(f.read())
+            trained = frozenset(data.get("feature_columns", []))
+        except (ValueError, AttributeError):
+            trained = frozenset()
+        self._trained_cache = (key, trained)
+        return trained
     
     def check_staleness(self) -> Dict[str, Any]:
         """
         Check if model is stale (missing new features).
         Returns status dict with details.
         """
-        current = set(self.CURRENT_FEATURES)
+        current = self._CURRENT_FEATURES_FS
         trained = self.get_trained_features()
         
         if not trained:
@@ -1,19 +1,22 @@
 
 import logging
+import numpy as np
 import pandas as pd
 import xgboost as xgb
 import lightgbm as lgb
 from sklearn.metrics import accuracy_score, roc_auc_score
 import joblib
 import os
+import pickle
 import optuna
 from sklearn.linear_model import LogisticRegression
 
 logger = logging.getLogger(__name__)
 
 class PolicyTrainer:
-    def __init__(self, model_type="xgboost", **kwargs):
+    def __init__(self, model_type="xgboost", n_jobs=None, **kwargs):
         self.model_type = model_type.lower()
+        self.n_jobs = n_jobs
         self.params = kwargs
         
         # Default Params if empty
@@ -25,6 +28,7 @@ class PolicyTrainer:
                     "n_estimators": 200,
                     "subsample": 0.8,
                     "colsample_bytree": 0.8,
+                    "tree_method": "hist",
                     "eval_metric": "logloss",
                     "random_state": 42
                 }
@@ -41,6 +45,10 @@ class PolicyTrainer:
                     "random_state": 42
                 }
         
+        # Thread cap per trainer (set when several trainers run side by side)
+        if n_jobs is not None:
+            self.params["n_jobs"] = n_jobs
+        
         self.model = self._init_model()
         self.calibrator = None
         
@@ -64,14 +72,16 @@ class PolicyTrainer:
         else:
             raise ValueError(f"Unsupported model type: {self.model_type}")
 
+    def _xy(self, df: pd.DataFrame):
+        """Features as float32, labels as int8: half the memory traffic while building histograms."""
+        return df[self.feature_cols].astype(np.float32), df[self.target_col].astype(np.int8)
+
     def train(self, train_df: pd.DataFrame, val_df: pd.DataFrame):
         """
         Trains the selected model and calculates metrics.
         """
-        X_train = train_df[self.feature_cols]
-        y_train = train_df[self.target_col]
-        X_val = val_df[self.feature_cols]
-        y_val = val_df[self.target_col]
+        X_train, y_train = self._xy(train_df)
+        X_val, y_val = self._xy(val_df)
 
         logger.info(f"Training {self.model_type} on {len(X_train)} rows...")
         
@@ -97,25 +107,42 @@ class PolicyTrainer:
         }
 
         # Probability calibration (Platt scaling on validation probabilities)
-        try:
-            calib = LogisticRegression(solver="lbfgs")
-            calib.fit(val_probs.reshape(-1, 1), y_val)
-            self.calibrator = calib
-            logger.info("Probability calibration fitted (Platt scaling).")
-        except Exception as e:
-            logger.warning(f"Calibration skipped: {e}")
+        if np.unique(y_val).size < 2 or val_probs.std() < 1e-6:
+            # Single-class labels or constant scores: nothing to fit
+            self.calibrator = None
+            logger.warning("Calibration skipped: degenerate validation labels or probabilities.")
+        else:
+            try:
+                # liblinear is the quicker solver for this 1-feature problem
+                calib = LogisticRegression(solver="liblinear")
+                calib.fit(val_probs.reshape(-1, 1), y_val)
+                self.calibrator = calib
+                logger.info("Probability calibration fitted (Platt scaling).")
+            except Exception as e:
+                logger.warning(f"Calibration skipped: {e}")
 
         logger.info(f"Training Results ({self.model_type}): {metrics}")
         return metrics
 
-    def optimize(self, train_df: pd.DataFrame, val_df: pd.DataFrame, n_trials=30):
+    def optimize(self, train_df: pd.DataFrame, val_df: pd.DataFrame, n_trials=30, n_parallel_trials=None):
         """
         Runs an Optuna study to find the best hyper-parameters.
+        n_parallel_trials: concurrent trials (default: one per core). Independent of n_jobs,
+        which only caps the threads of the model fitted by train().
         """
-        X_train = train_df[self.feature_cols]
-        y_train = train_df[self.target_col]
-        X_val = val_df[self.feature_cols]
-        y_val = val_df[self.target_col]
+        X_train, y_train = self._xy(train_df)
+        X_val, y_val = self._xy(val_df)
+
+        if self.model_type == "xgboost":
+            # Quantize once and share across trials instead of rebuilding per fit. Contiguous
+            # float32 blocks go straight into the DMatrix without pandas column dispatch.
+            names = list(self.feature_cols)
+            dtrain = xgb.QuantileDMatrix(
+                np.ascontiguousarray(X_train.to_numpy()),
+                label=y_train.to_numpy(), feature_names=names)
+            dval = xgb.QuantileDMatrix(
+                np.ascontiguousarray(X_val.to_numpy()),
+                label=y_val.to_numpy(), feature_names=names, ref=dtrain)
 
         def objective(trial):
             if self.model_type == "xgboost":
@@ -125,10 +152,16 @@ class PolicyTrainer:
                     "n_estimators": trial.suggest_int("n_estimators", 100, 500),
                     "subsample": trial.suggest_float("subsample", 0.6, 0.9),
                     "colsample_bytree": trial.suggest_float("colsample_bytree", 0.6, 0.9),
+                    "objective": "binary:logistic",
+                    "tree_method": "hist",
                     "eval_metric": "logloss",
-                    "random_state": 42
+                    "seed": 42
                 }
-                model = xgb.XGBClassifier(**params)
+                params["nthread"] = 1
+                # Native API: n_estimators is the boosting round count, not a booster param
+                num_rounds = params.pop("n_estimators")
+                booster = xgb.train(params, dtrain, num_boost_round=num_rounds)
+                return roc_auc_score(y_val, booster.predict(dval))
             elif self.model_type == "lightgbm":
                 params = {
                     "max_depth": trial.suggest_int("max_depth", 3, 10),
@@ -144,13 +177,17 @@ class PolicyTrainer:
                 }
                 model = lgb.LGBMClassifier(**params)
             
+            model.set_params(n_jobs=1)
             model.fit(X_train, y_train)
             val_probs = model.predict_proba(X_val)[:, 1]
             return roc_auc_score(y_val, val_probs)
 
-        logger.info(f"Starting {self.model_type} optimization ({n_trials} trials)...")
+        # Trials are independent fits: run them on parallel threads (both libraries release
+        # the GIL while training), one model thread each so the pool sets total CPU use
+        parallel_trials = n_parallel_trials or os.cpu_count() or 1
+        logger.info(f"Starting {self.model_type} optimization ({n_trials} trials, {parallel_trials} parallel)...")
         study = optuna.create_study(direction="maximize")
-        study.optimize(objective, n_trials=n_trials)
+        study.optimize(objective, n_trials=n_trials, n_jobs=parallel_trials)
 
         logger.info(f"Optimization finished. Best AUC: {study.best_value:.4f}")
         self.params.update(study.best_params)
@@ -158,8 +195,13 @@ class PolicyTrainer:
         
         return study.best_params
 
-    def save_model(self, path: str):
-        os.makedirs(os.path.dirname(path), exist_ok=True)
+    def save_model(self, path: str, export_booster: bool = False):
+        """
+        Saves the joblib artifact. With export_booster, an xgboost model also gets its raw
+        booster written next to it (same name, .json) for PolicyInference's low-latency path.
+        """
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
         # We save metadata too
         save_data = {
             "model": self.model,
@@ -168,8 +210,24 @@ class PolicyTrainer:
             "feature_cols": self.feature_cols,
             "calibrator": self.calibrator
         }
-        joblib.dump(save_data, path)
+        # Protocol 5 writes XGBoost's raw booster (a bytearray) with its native BYTEARRAY8 opcode;
+        # protocol 4 reduces it through a bytearray(bytes) call, an extra copy on load
+        joblib.dump(save_data, path, protocol=pickle.HIGHEST_PROTOCOL)
         logger.info(f"Model ({self.model_type}) saved to {path}")
+        if export_booster and self.model_type == "xgboost":
+            self.export_booster(os.path.splitext(path)[0] + ".json")
+
+    def export_booster(self, path: str):
+        """
+        Writes the raw XGBoost booster as JSON/UBJ (by extension) for PolicyInference's
+        low-latency path. Calibrator and params stay in the joblib artifact only.
+        """
+        if self.model_type != "xgboost":
+            raise ValueError(f"Booster export is only supported for xgboost, not {self.model_type}")
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        self.model.get_booster().save_model(path)
+        logger.info(f"Booster exported to {path}")
 
     def load_model(self, path: str):
         if os.path.exists(path):
@@ -16,6 +16,12 @@ class CanaryState:
 class CanaryMonitor:
     def __init__(self, initial_equity: float):
         self.state = CanaryState(peak_equity=initial_equity)
+        # Config is static for the life of the process; read it once.
+        self._mode = Config.CANARY_MODE
+        self._limit = Config.CANARY_TRADE_LIMIT
+        self._min_wr = Config.CANARY_MIN_WIN_RATE
+        self._max_dd = Config.CANARY_MAX_DD_PCT
+        self._inv_peak = 1.0 / max(1e-9, initial_equity)
 
     def record_trade(self, pnl_pct: float):
         self.state.trades += 1
@@ -25,21 +31,22 @@ class CanaryMonitor:
     def update_equity(self, equity: float):
         if equity > self.state.peak_equity:
             self.state.peak_equity = equity
+            self._inv_peak = 1.0 / max(1e-9, equity)
 
     def check(self, equity: float) -> Optional[str]:
-        if not Config.CANARY_MODE:
+        if not self._mode:
             return None
         self.update_equity(equity)
-        if self.state.trades < Config.CANARY_TRADE_LIMIT:
+        if self.state.trades < self._limit:
             return None
         win_rate = self.state.wins / max(1, self.state.trades)
-        drawdown = (self.state.peak_equity - equity) / max(1e-9, self.state.peak_equity) * 100
-        if win_rate < Config.CANARY_MIN_WIN_RATE:
+        if win_rate < self._min_wr:
             self.state.halted = True
-            self.state.reason = f"Canary win rate {win_rate:.2f} < {Config.CANARY_MIN_WIN_RATE:.2f}"
+            self.state.reason = f"Canary win rate {win_rate:.2f} < {self._min_wr:.2f}"
             return self.state.reason
-        if drawdown > Config.CANARY_MAX_DD_PCT:
+        drawdown = (self.state.peak_equity - equity) * self._inv_peak * 100
+        if drawdown > self._max_dd:
             self.state.halted = True
-            self.state.reason = f"Canary DD {drawdown:.2f}% > {Config.CANARY_MAX_DD_PCT:.2f}%"
+            self.state.reason = f"Canary DD {drawdown:.2f}% > {self._max_dd:.2f}%"
             return self.state.reason
         return None
@@ -2,21 +2,31 @@
 Decision Audit Logger - Solution #3
 Tracks which systems influenced each trading decision for debugging.
 """
-import json
+import atexit
 import os
 import logging
-from dataclasses import dataclass, field, asdict
-from typing import Optional, Dict, Any, List
+import random
+import threading
+import time
+from dataclasses import dataclass, field, fields
 from datetime import datetime, timezone
+from typing import Optional, Dict, Any, List, Union
+from src.config import Config
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class DecisionAudit:
     """Complete audit trail for a single trading decision."""
     decision_id: str
-    timestamp: str = ""
+    # Epoch seconds from create_audit; the writer thread turns it into an ISO string
+    timestamp: Union[float, str] = ""
     symbol: str = ""
     
     # Final outcome
@@ -53,7 +63,47 @@ class DecisionAudit:
     blocked_reasons: List[str] = field(default_factory=list)
     
     def to_dict(self) -> Dict[str, Any]:
-        return asdict(self)
+        # Flat record, so a shallow literal is enough (asdict would deep-copy blocked_reasons).
+        return {
+            "decision_id": self.decision_id, "timestamp": self.timestamp, "symbol": self.symbol,
+            "action": self.action, "direction": self.direction, "strategy": self.strategy,
+            "ml_confidence": self.ml_confidence, "ml_passed": self.ml_passed,
+            "ev_value": self.ev_value, "ev_passed": self.ev_passed,
+            "strategy_weight": self.strategy_weight, "strategy_blocked": self.strategy_blocked,
+            "regime": self.regime, "regime_confidence": self.regime_confidence,
+            "risk_state": self.risk_state, "drawdown_pct": self.drawdown_pct,
+            "open_positions": self.open_positions, "position_blocked": self.position_blocked,
+            "rsi": self.rsi, "trend_spread": self.trend_spread,
+            "htf_trend_spread": self.htf_trend_spread, "volume_zscore": self.volume_zscore,
+            "blocked_reasons": self.blocked_reasons,
+        }
+
+
+_FIELDS = tuple(f.name for f in fields(DecisionAudit))
+
+
+def _json_default(obj):
+    """numpy scalars (np.float64, np.int64, np.bool_) leak in from indicator math."""
+    item = getattr(obj, "item", None)
+    if callable(item):
+        return item()
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+class _NullAudit:
+    """Shared stand-in for audits that are never recorded (auditing disabled or sampled out)."""
+    __slots__ = ()
+
+
+_NULL_AUDIT = _NullAudit()
+
+
+def _to_json(audit: DecisionAudit) -> bytes:
+    """One JSONL record. orjson serializes the dataclass natively, no intermediate dict."""
+    if orjson is not None:
+        return orjson.dumps(audit, default=_json_default, option=orjson.OPT_SERIALIZE_NUMPY)
+    import json
+    return json.dumps({k: getattr(audit, k) for k in _FIELDS}, default=_json_default).encode("utf-8")
 
 
 class DecisionAuditor:
@@ -62,20 +112,35 @@ class DecisionAuditor:
     Answers the question: "Why did the bot do X?"
     """
     
-    def __init__(self, log_path: str = "data/decision_audit.jsonl"):
+    FLUSH_INTERVAL_SEC = 0.05
+    MAX_BUFFERED = 256
+    TAIL_CHUNK = 64 * 1024
+
+    def __init__(self, log_path: str = "data/decision_audit.jsonl", max_bytes: Optional[int] = None,
+                 sample_rate: float = 1.0):
         self.log_path = log_path
+        self.sample_rate = sample_rate
+        # When set, the live file is rotated to decision_audit.N.jsonl once it grows past this size.
+        self.max_bytes = max_bytes
         os.makedirs(os.path.dirname(log_path), exist_ok=True)
+        # save() only enqueues; a daemon thread formats, serializes and batches the writes.
+        self._buf: List[DecisionAudit] = []
+        self._lock = threading.Lock()
+        self._write_lock = threading.Lock()
+        self._fh = None
+        self._stop = threading.Event()
+        self._flusher: Optional[threading.Thread] = None
     
-    def create_audit(self, decision_id: str, symbol: str = "") -> DecisionAudit:
-        """Start a new audit trail for a decision."""
-        return DecisionAudit(
-            decision_id=decision_id,
-            timestamp=datetime.now(timezone.utc).isoformat(),
-            symbol=symbol
-        )
+    def create_audit(self, decision_id: str, symbol: str = ""):
+        """Start a new audit trail for a decision. Sampled-out decisions get the shared no-op audit."""
+        if self.sample_rate < 1.0 and random.random() >= self.sample_rate:
+            return _NULL_AUDIT
+        return DecisionAudit(decision_id=decision_id, timestamp=time.time(), symbol=symbol)
     
     def log_ml_result(self, audit: DecisionAudit, confidence: float, threshold: float):
         """Record ML model prediction."""
+        if audit is _NULL_AUDIT:
+            return
         audit.ml_confidence = confidence
         audit.ml_passed = confidence >= threshold
         if not audit.ml_passed:
@@ -83,6 +148,8 @@ class DecisionAuditor:
     
     def log_ev_result(self, audit: DecisionAudit, ev_value: float, threshold: float):
         """Record expected value calculation."""
+        if audit is _NULL_AUDIT:
+            return
         audit.ev_value = ev_value
         audit.ev_passed = ev_value >= threshold
         if not audit.ev_passed:
@@ -90,6 +157,8 @@ class DecisionAuditor:
     
     def log_strategy_filter(self, audit: DecisionAudit, strategy: str, weight: float, blocked: bool, reason: str = ""):
         """Record strategy filtering result."""
+        if audit is _NULL_AUDIT:
+            return
         audit.strategy = strategy
         audit.strategy_weight = weight
         audit.strategy_blocked = blocked
@@ -98,6 +167,8 @@ class DecisionAuditor:
     
     def log_risk_state(self, audit: DecisionAudit, risk_state: str, drawdown: float, open_positions: int, max_positions: int):
         """Record risk state."""
+        if audit is _NULL_AUDIT:
+            return
         audit.risk_state = risk_state
         audit.drawdown_pct = drawdown
         audit.open_positions = open_positions
@@ -110,6 +181,8 @@ class DecisionAuditor:
     def log_market_context(self, audit: DecisionAudit, regime: str, regime_confidence: float,
                            rsi: float, trend_spread: float, htf_trend_spread: float, volume_zscore: float):
         """Record market context."""
+        if audit is _NULL_AUDIT:
+            return
         audit.regime = regime
         audit.regime_confidence = regime_confidence
         audit.rsi = rsi
@@ -119,27 +192,112 @@ class DecisionAuditor:
     
     def log_final_action(self, audit: DecisionAudit, action: str, direction: str):
         """Record final action taken."""
+        if audit is _NULL_AUDIT:
+            return
         audit.action = action
         audit.direction = direction
     
     def save(self, audit: DecisionAudit):
-        """Persist audit to JSONL file."""
-        with open(self.log_path, "a", encoding="utf-8") as f:
-            f.write(json.dumps(audit.to_dict()) + "\n")
+        """Queue audit for the background JSONL writer. Do not modify it afterwards."""
+        if audit is _NULL_AUDIT:
+            return
+        with self._lock:
+            self._buf.append(audit)
+            pending = len(self._buf)
+        if self._stop.is_set() or pending >= self.MAX_BUFFERED:
+            self.flush()
+        elif self._flusher is None:
+            self._start_flusher()
+
+    def flush(self):
+        """Write all queued audits in one call."""
+        with self._write_lock:
+            with self._lock:
+                audits, self._buf = self._buf, []
+            lines = []
+            for audit in audits:
+                if isinstance(audit.timestamp, float):
+                    audit.timestamp = datetime.fromtimestamp(audit.timestamp, timezone.utc).isoformat()
+                try:
+                    lines.append(_to_json(audit) + b"\n")
+                except (TypeError, ValueError) as e:
+                    logger.error(f"Decision audit {audit.decision_id} not serializable: {e}")
+            if not lines:
+                return
+            if self._fh is None:
+                self._fh = open(self.log_path, "ab", buffering=1 << 16)
+            # Rotate before writing so the newest batch always lands in the live file.
+            if self.max_bytes is not None and 0 < self._fh.tell() >= self.max_bytes:
+                self._rotate()
+            self._fh.write(b"".join(lines))
+            self._fh.flush()
+
+    def _rotate(self):
+        """Move the live file aside as <name>.N<ext>. Caller holds _write_lock."""
+        self._fh.close()
+        self._fh = None
+        base, ext = os.path.splitext(self.log_path)
+        n = 1
+        while os.path.exists(f"{base}.{n}{ext}"):
+            n += 1
+        os.replace(self.log_path, f"{base}.{n}{ext}")
+        self._fh = open(self.log_path, "ab", buffering=1 << 16)
+
+    def close(self):
+        """Stop the writer thread and flush what is left."""
+        self._stop.set()
+        if self._flusher is not None and self._flusher is not threading.current_thread():
+            self._flusher.join()
+        self.flush()
+        with self._write_lock:
+            if self._fh is not None:
+                self._fh.close()
+                self._fh = None
+
+    def _start_flusher(self):
+        with self._lock:
+            if self._flusher is not None:
+                return
+            self._flusher = threading.Thread(target=self._flush_loop, name="decision-audit-writer", daemon=True)
+            self._flusher.start()
+        atexit.register(self.close)
+
+    def _flush_loop(self):
+        while not self._stop.wait(self.FLUSH_INTERVAL_SEC):
+            try:
+                self.flush()
+            except OSError as e:
+                logger.error(f"Decision audit flush failed: {e}")
     
     def get_recent(self, count: int = 20) -> List[Dict[str, Any]]:
         """Get recent audit entries for debugging."""
-        if not os.path.exists(self.log_path):
+        self.flush()
+        if count <= 0 or not os.path.exists(self.log_path):
             return []
-        
-        with open(self.log_path, "r", encoding="utf-8") as f:
-            lines = f.readlines()
-        
+
+        # Read backwards from EOF until we hold count complete lines.
+        with open(self.log_path, "rb") as f:
+            pos = f.seek(0, os.SEEK_END)
+            data = b""
+            while pos > 0 and data.count(b"\n") <= count:
+                step = min(self.TAIL_CHUNK, pos)
+                pos -= step
+                f.seek(pos)
+                data = f.read(step) + data
+        lines = data.splitlines()
+        if pos > 0:
+            lines = lines[1:]  # partial line at the chunk boundary
+
+        if orjson is not None:
+            loads = orjson.loads
+        else:
+            from json import loads
+
         recent = []
         for line in lines[-count:]:
             try:
-                recent.append(json.loads(line.strip()))
-            except json.JSONDecodeError:
+                recent.append(loads(line))
+            except ValueError:
                 continue
         return recent
     
@@ -166,11 +324,57 @@ class DecisionAuditor:
         return "\n".join(lines)
 
 
+class _NullAuditor:
+    """Stand-in used when auditing is disabled: every call is a no-op and nothing is written."""
+    log_path = None
+
+    def create_audit(self, decision_id: str, symbol: str = ""):
+        return _NULL_AUDIT
+
+    def log_ml_result(self, audit, confidence: float, threshold: float):
+        pass
+
+    def log_ev_result(self, audit, ev_value: float, threshold: float):
+        pass
+
+    def log_strategy_filter(self, audit, strategy: str, weight: float, blocked: bool, reason: str = ""):
+        pass
+
+    def log_risk_state(self, audit, risk_state: str, drawdown: float, open_positions: int, max_positions: int):
+        pass
+
+    def log_market_context(self, audit, regime: str, regime_confidence: float,
+                           rsi: float, trend_spread: float, htf_trend_spread: float, volume_zscore: float):
+        pass
+
+    def log_final_action(self, audit, action: str, direction: str):
+        pass
+
+    def save(self, audit):
+        pass
+
+    def flush(self):
+        pass
+
+    def close(self):
+        pass
+
+    def get_recent(self, count: int = 20) -> List[Dict[str, Any]]:
+        return []
+
+    def explain_last_decision(self) -> str:
+        return "Decision auditing is disabled."
+
+
+_NULL_AUDITOR = _NullAuditor()
+
 # Global instance for easy access
 _auditor = None
 
-def get_auditor(log_path: str = "data/decision_audit.jsonl") -> DecisionAuditor:
+def get_auditor(log_path: str = "data/decision_audit.jsonl"):
     global _auditor
+    if not Config.DECISION_AUDIT_ENABLED or Config.DECISION_AUDIT_SAMPLE_RATE <= 0:
+        return _NULL_AUDITOR
     if _auditor is None:
-        _auditor = DecisionAuditor(log_path)
+        _auditor = DecisionAuditor(log_path, sample_rate=Config.DECISION_AUDIT_SAMPLE_RATE)
     return _auditor
@@ -1,19 +1,23 @@
 import math
 from collections import deque
-from typing import Dict, Deque, Tuple, List
+from typing import Dict, List
 
 
 class DriftMonitor:
     """
     Simple feature drift tracker using rolling z-scores.
+
+    Rolling mean/variance are maintained incrementally (Welford add/remove),
+    so each update is O(1) per feature regardless of window size.
     """
     def __init__(self, window: int = 200, alert_z: float = 3.0):
         self.window = window
         self.alert_z = alert_z
-        self.values: Dict[str, Deque[float]] = {}
+        self.stats: Dict[str, dict] = {}
 
     def update(self, features: Dict[str, float]) -> List[str]:
         alerts: List[str] = []
+        min_count = max(10, self.window // 2)
         for k, v in features.items():
             if v is None or isinstance(v, bool):
                 continue
@@ -21,13 +25,41 @@ class DriftMonitor:
                 v = float(v)
             except (TypeError, ValueError):
                 continue
-            if k not in self.values:
-                self.values[k] = deque(maxlen=self.window)
-            q = self.values[k]
+            if not math.isfinite(v):
+                continue  # NaN/inf would poison the running mean/M2 for good
+            s = self.stats.get(k)
+            if s is None:
+                s = self.stats[k] = {"q": deque(maxlen=self.window), "mean": 0.0, "M2": 0.0}
+            q = s["q"]
+            mean = s["mean"]
+            m2 = s["M2"]
+
+            # Evict the oldest sample first (symmetric Welford remove).
+            if len(q) == q.maxlen:
+                old = q[0]
+                n = len(q) - 1
+                if n > 0:
+                    new_mean = mean + (mean - old) / n
+                    m2 -= (old - mean) * (old - new_mean)
+                    mean = new_mean
+                else:
+                    mean, m2 = 0.0, 0.0
+
             q.append(v)
-            if len(q) >= max(10, self.window // 2):
+            delta = v - mean
+            mean += delta / len(q)
+            m2 += delta * (v - mean)
+            if not (math.isfinite(mean) and math.isfinite(m2)):
+                # Overflow on extreme magnitudes: rebuild from the window
                 mean = sum(q) / len(q)
-                var = sum((x - mean) ** 2 for x in q) / len(q)
+                m2 = sum((x - mean) * (x - mean) for x in q)
+            if m2 < 0.0:
+                m2 = 0.0
+            s["mean"] = mean
+            s["M2"] = m2
+
+            if len(q) >= min_count:
+                var = m2 / len(q)
                 std = math.sqrt(var) if var > 0 else 0.0
                 if std > 0:
                     z = (v - mean) / std
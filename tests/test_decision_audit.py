@@ -0,0 +1,179 @@
+import json
+import os
+import glob
+import shutil
+import tempfile
+import threading
+import time
+import unittest
+from datetime import datetime
+from unittest import mock
+
+import numpy as np
+
+from src.monitoring import decision_audit
+from src.monitoring.decision_audit import DecisionAuditor, _NULL_AUDITOR
+
+
+class TestDecisionAuditor(unittest.TestCase):
+    def setUp(self):
+        self.test_data_dir = tempfile.mkdtemp(prefix="audit_test_")
+        self.log_path = os.path.join(self.test_data_dir, "decision_audit.jsonl")
+
+    def tearDown(self):
+        shutil.rmtree(self.test_data_dir, ignore_errors=True)
+
+    def _read_lines(self, path=None):
+        with open(path or self.log_path, "rb") as f:
+            return [json.loads(line) for line in f]
+
+    def test_save_numpy_scalars(self):
+        for use_orjson in (True, False):
+            with self.subTest(orjson=use_orjson):
+                with mock.patch.object(decision_audit, "orjson", decision_audit.orjson if use_orjson else None):
+                    auditor = DecisionAuditor(self.log_path)
+                    audit = auditor.create_audit("np-1", "BTC/USDT")
+                    auditor.log_ml_result(audit, np.float64(0.72), 0.65)
+                    auditor.log_risk_state(audit, "SAFE", np.float32(1.5), np.int64(2), 5)
+                    audit.ml_passed = np.bool_(True)
+                    auditor.save(audit)
+                    auditor.close()
+                record = self._read_lines()[-1]
+                self.assertEqual(record["decision_id"], "np-1")
+                self.assertAlmostEqual(record["ml_confidence"], 0.72)
+                self.assertAlmostEqual(record["drawdown_pct"], 1.5)
+                self.assertEqual(record["open_positions"], 2)
+                self.assertIs(record["ml_passed"], True)
+
+    def _auditor(self, **kwargs) -> DecisionAuditor:
+        auditor = DecisionAuditor(self.log_path, **kwargs)
+        self.addCleanup(auditor.close)
+        return auditor
+
+    def _save_ids(self, auditor, ids):
+        for decision_id in ids:
+            auditor.save(auditor.create_audit(decision_id, "BTC/USDT"))
+
+    def test_concurrent_saves_write_intact_lines(self):
+        auditor = self._auditor()
+        threads = [
+            threading.Thread(target=self._save_ids, args=(auditor, [f"t{t}-{i}" for i in range(200)]))
+            for t in range(8)
+        ]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        auditor.close()
+
+        records = self._read_lines()  # json.loads fails on any torn/interleaved line
+        self.assertEqual(len(records), 8 * 200)
+        self.assertEqual({r["decision_id"] for r in records},
+                         {f"t{t}-{i}" for t in range(8) for i in range(200)})
+        for t in range(8):
+            own = [r["decision_id"] for r in records if r["decision_id"].startswith(f"t{t}-")]
+            self.assertEqual(own, [f"t{t}-{i}" for i in range(200)])
+
+    def test_close_flushes_buffer(self):
+        auditor = self._auditor()
+        auditor.FLUSH_INTERVAL_SEC = 60  # background thread never fires during the test
+        self._save_ids(auditor, ["a", "b", "c"])
+        self.assertFalse(os.path.exists(self.log_path) and os.path.getsize(self.log_path))
+
+        auditor.close()
+        self.assertEqual([r["decision_id"] for r in self._read_lines()], ["a", "b", "c"])
+
+        # After close, saves are written straight through
+        self._save_ids(auditor, ["d"])
+        self.assertEqual(self._read_lines()[-1]["decision_id"], "d")
+
+    def test_full_buffer_flushes_inline(self):
+        auditor = self._auditor()
+        auditor.FLUSH_INTERVAL_SEC = 60
+        auditor.MAX_BUFFERED = 5
+        self._save_ids(auditor, [str(i) for i in range(4)])
+        self.assertFalse(os.path.exists(self.log_path) and os.path.getsize(self.log_path))
+        self._save_ids(auditor, ["4"])
+        self.assertEqual(len(self._read_lines()), 5)
+
+    def test_get_recent_sees_unflushed_saves(self):
+        auditor = self._auditor()
+        auditor.FLUSH_INTERVAL_SEC = 60
+        self._save_ids(auditor, [str(i) for i in range(10)])
+        self.assertEqual([r["decision_id"] for r in auditor.get_recent(3)], ["7", "8", "9"])
+
+    def test_rotation_at_max_bytes(self):
+        auditor = self._auditor(max_bytes=2000)
+        ids = [f"r{i}" for i in range(60)]
+        for decision_id in ids:
+            self._save_ids(auditor, [decision_id])
+            auditor.flush()
+        auditor.close()
+
+        base, ext = os.path.splitext(self.log_path)
+        rotated = sorted(glob.glob(f"{base}.*{ext}"), key=lambda p: int(p[len(base) + 1:-len(ext)]))
+        self.assertGreater(len(rotated), 1)
+        for path in rotated:
+            self.assertGreaterEqual(os.path.getsize(path), 2000)
+        self.assertLess(os.path.getsize(self.log_path), 2000 + 1000)
+
+        # Nothing lost or reordered across the rotated files and the live file
+        written = [r["decision_id"] for path in rotated + [self.log_path] for r in self._read_lines(path)]
+        self.assertEqual(written, ids)
+        self.assertEqual(auditor.get_recent(1)[0]["decision_id"], ids[-1])
+
+    def _log_everything(self, auditor, audit):
+        auditor.log_ml_result(audit, 0.4, 0.65)
+        auditor.log_ev_result(audit, -0.1, 0.0)
+        auditor.log_strategy_filter(audit, "TREND", 0.5, True, "cooldown")
+        auditor.log_risk_state(audit, "DANGER", 12.0, 3, 3)
+        auditor.log_market_context(audit, "BULL", 0.9, 55.0, 0.01, 0.02, 1.2)
+        auditor.log_final_action(audit, "WAIT", "FLAT")
+        auditor.save(audit)
+
+    def test_disabled_auditor_accepts_the_full_call_sequence(self):
+        audit = _NULL_AUDITOR.create_audit("off-1", "BTC/USDT")
+        self.assertIs(_NULL_AUDITOR.create_audit("off-2"), audit)  # one shared object
+        self._log_everything(_NULL_AUDITOR, audit)
+        self.assertEqual(_NULL_AUDITOR.get_recent(), [])
+
+    def test_sampled_out_audit_is_a_no_op(self):
+        auditor = self._auditor(sample_rate=0.5)
+        with mock.patch.object(decision_audit.random, "random", return_value=0.9):
+            audit = auditor.create_audit("skip-1", "BTC/USDT")
+        self.assertIs(audit, _NULL_AUDITOR.create_audit("x"))
+        self._log_everything(auditor, audit)
+        with mock.patch.object(decision_audit.random, "random", return_value=0.1):
+            self._log_everything(auditor, auditor.create_audit("keep-1", "BTC/USDT"))
+        auditor.close()
+        self.assertEqual([r["decision_id"] for r in self._read_lines()], ["keep-1"])
+
+    def test_timestamp_is_decision_time_formatted_by_writer(self):
+        auditor = self._auditor()
+        auditor.FLUSH_INTERVAL_SEC = 60
+        before = time.time()
+        audit = auditor.create_audit("ts-1", "BTC/USDT")
+        after = time.time()
+        self.assertIsInstance(audit.timestamp, float)
+        auditor.save(audit)
+        auditor.close()
+        stamp = datetime.fromisoformat(self._read_lines()[-1]["timestamp"])
+        self.assertIsNotNone(stamp.tzinfo)
+        self.assertGreaterEqual(stamp.timestamp(), before - 1e-6)
+        self.assertLessEqual(stamp.timestamp(), after + 1e-6)
+
+    def test_unserializable_audit_does_not_drop_the_batch(self):
+        auditor = self._auditor()
+        auditor.FLUSH_INTERVAL_SEC = 60
+        self._save_ids(auditor, ["ok-1"])
+        bad = auditor.create_audit("bad-1", "BTC/USDT")
+        bad.blocked_reasons.append(object())
+        auditor.save(bad)
+        self._save_ids(auditor, ["ok-2"])
+        with self.assertLogs(decision_audit.logger, "ERROR"):
+            auditor.close()
+        self.assertEqual([r["decision_id"] for r in self._read_lines()], ["ok-1", "ok-2"])
+
+
+if __name__ == "__main__":
+    unittest.main()
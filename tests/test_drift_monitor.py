@@ -0,0 +1,60 @@
+import math
+import random
+import unittest
+
+from src.monitoring.drift import DriftMonitor
+
+
+def _normal_ticks(n, seed=0):
+    rng = random.Random(seed)
+    return [rng.gauss(50.0, 2.0) for _ in range(n)]
+
+
+class TestDriftMonitor(unittest.TestCase):
+    def test_outlier_alerts(self):
+        monitor = DriftMonitor(window=50, alert_z=3.0)
+        for v in _normal_ticks(100):
+            monitor.update({"rsi": v})
+        alerts = monitor.update({"rsi": 80.0})
+        self.assertEqual(len(alerts), 1)
+        self.assertTrue(alerts[0].startswith("rsi: z="))
+
+    def test_non_finite_sample_is_skipped(self):
+        for bad in (float("nan"), float("inf"), float("-inf")):
+            with self.subTest(bad=bad):
+                monitor = DriftMonitor(window=50, alert_z=3.0)
+                self.assertEqual(monitor.update({"rsi": bad}), [])
+                for v in _normal_ticks(100):
+                    monitor.update({"rsi": v})
+                stats = monitor.stats["rsi"]
+                self.assertTrue(math.isfinite(stats["mean"]))
+                self.assertTrue(math.isfinite(stats["M2"]))
+                self.assertEqual(len(monitor.update({"rsi": 80.0})), 1)
+
+    def test_stats_recover_after_overflow(self):
+        # Finite but extreme values overflow the Welford deltas; the stats must
+        # rebuild from the window once those values are evicted.
+        monitor = DriftMonitor(window=50, alert_z=3.0)
+        monitor.update({"rsi": 1e308})
+        monitor.update({"rsi": -1e308})
+        for v in _normal_ticks(100):
+            monitor.update({"rsi": v})
+        stats = monitor.stats["rsi"]
+        self.assertTrue(math.isfinite(stats["mean"]))
+        self.assertTrue(math.isfinite(stats["M2"]))
+        self.assertEqual(len(monitor.update({"rsi": 80.0})), 1)
+
+    def test_matches_full_window_recompute(self):
+        monitor = DriftMonitor(window=30, alert_z=3.0)
+        values = _normal_ticks(200, seed=1)
+        for v in values:
+            monitor.update({"x": v})
+        window = values[-30:]
+        mean = sum(window) / len(window)
+        m2 = sum((x - mean) ** 2 for x in window)
+        self.assertAlmostEqual(monitor.stats["x"]["mean"], mean, places=9)
+        self.assertAlmostEqual(monitor.stats["x"]["M2"], m2, places=6)
+
+
+if __name__ == "__main__":
+    unittest.main()
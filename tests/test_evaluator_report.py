@@ -0,0 +1,47 @@
+import json
+import os
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+
+import numpy as np
+
+from src.ml import evaluator
+from src.ml.evaluator import PolicyEvaluator
+
+
+class TestSaveReport(unittest.TestCase):
+    def setUp(self):
+        self.test_data_dir = tempfile.mkdtemp(prefix="evaluator_test_")
+        self.path = os.path.join(self.test_data_dir, "report.json")
+        self.report = {
+            "metrics": {"test_accuracy": 0.5, "test_roc_auc": float("nan"), "rows": np.int64(40)},
+            "feature_importance": {"rsi": np.float32(0.25), "atr": np.float32(np.inf)},
+            "notes": "µ",
+        }
+
+    def tearDown(self):
+        shutil.rmtree(self.test_data_dir, ignore_errors=True)
+
+    def _save(self):
+        PolicyEvaluator.save_report(None, self.report, self.path)
+        with open(self.path, "rb") as f:
+            return f.read()
+
+    def test_encoder_paths_write_identical_utf8(self):
+        with_orjson = self._save()
+        with mock.patch.object(evaluator, "orjson", None):
+            with_json = self._save()
+        self.assertEqual(with_orjson, with_json)
+
+        saved = json.loads(with_orjson.decode("utf-8"))
+        self.assertIsNone(saved["metrics"]["test_roc_auc"])
+        self.assertIsNone(saved["feature_importance"]["atr"])
+        self.assertEqual(saved["metrics"]["rows"], 40)
+        self.assertEqual(saved["feature_importance"]["rsi"], 0.25)
+        self.assertEqual(saved["notes"], "µ")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,189 @@
+import json
+import os
+import random
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+
+from src.ml.pipeline import AdaptivePipeline
+
+
+def _record(i, resolved, nested=None):
+    record = {"id": f"d{i}", "market_state": {"symbol": "BTC/USDT", "rsi": 50.0 + i % 7}, "resolved": resolved}
+    if nested is not None:
+        record["metadata"] = {"resolved": nested, "note": '"resolved": true'}
+    return record
+
+
+class TestResolvedCount(unittest.TestCase):
+    def setUp(self):
+        self.test_data_dir = tempfile.mkdtemp(prefix="pipeline_test_")
+        self.log_path = os.path.join(self.test_data_dir, "experience_log.jsonl")
+        with mock.patch("src.ml.pipeline.ModelRegistry"):
+            self.pipeline = AdaptivePipeline(data_log_path=self.log_path)
+
+    def tearDown(self):
+        shutil.rmtree(self.test_data_dir, ignore_errors=True)
+
+    def _append(self, records, partial=b""):
+        with open(self.log_path, "ab") as f:
+            for r in records:
+                f.write((json.dumps(r) + "\n").encode("utf-8"))
+            f.write(partial)
+
+    def _rewrite(self, records):
+        # Same pattern as ExperienceDB.finalize_record: full rewrite + os.replace
+        temp_path = self.log_path + ".tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            for r in records:
+                f.write(json.dumps(r) + "\n")
+        os.replace(temp_path, self.log_path)
+
+    def _brute_force(self):
+        if not os.path.exists(self.log_path):
+            return 0
+        with open(self.log_path, "rb") as f:
+            data = f.read()
+        complete = data[:data.rfind(b"\n") + 1]
+        return sum(1 for line in complete.splitlines() if line.strip() and json.loads(line).get("resolved") is True)
+
+    def assertCountMatches(self):
+        expected = self._brute_force()
+        self.assertEqual(self.pipeline._count_resolved(), expected)
+        # Fresh pipeline with no checkpoint must agree too
+        os.remove(self.pipeline._resolved_cache_path)
+        self.assertEqual(self.pipeline._count_resolved(), expected)
+
+    def test_missing_log(self):
+        self.assertEqual(self.pipeline._count_resolved(), 0)
+
+    def test_append_scans_only_new_bytes(self):
+        records = [_record(i, i % 3 == 0) for i in range(50)]
+        self._append(records)
+        self.assertCountMatches()
+
+        more = [_record(i, i % 2 == 0) for i in range(50, 80)]
+        self._append(more)
+        with mock.patch.object(AdaptivePipeline, "_count_resolved_span",
+                               wraps=AdaptivePipeline._count_resolved_span) as span:
+            self.assertEqual(self.pipeline._count_resolved(), self._brute_force())
+        first_line_len = len(json.dumps(records[0])) + 1
+        (_, start, end), _ = span.call_args
+        self.assertGreater(start, first_line_len)  # resumed from the checkpoint, not byte 0
+        self.assertEqual(end, os.path.getsize(self.log_path))
+
+    def test_unchanged_log_uses_cached_count(self):
+        self._append([_record(i, True) for i in range(10)])
+        self.assertEqual(self.pipeline._count_resolved(), 10)
+        with mock.patch("src.ml.pipeline.mmap.mmap") as mapped:
+            self.assertEqual(self.pipeline._count_resolved(), 10)
+        mapped.assert_not_called()
+
+    def test_malformed_checkpoint_forces_rescan(self):
+        self._append([_record(i, i % 2 == 0) for i in range(20)])
+        expected = self._brute_force()
+        st = os.stat(self.log_path)
+        good = {"size": st.st_size, "mtime_ns": st.st_mtime_ns, "offset": st.st_size,
+                "tail": "", "resolved_count": 999}
+        bad_sidecars = {
+            "truncated": b'{"size": 12, "offs',
+            "list": b"[]",
+            "scalar": b"42",
+            "missing_tail": json.dumps({k: v for k, v in good.items() if k != "tail"}).encode(),
+            "bad_hex": json.dumps(dict(good, tail="zz")).encode(),
+            "wrong_types": json.dumps(dict(good, size="12", resolved_count=None)).encode(),
+            "negative_offset": json.dumps(dict(good, offset=-5)).encode(),
+            "empty": b"",
+        }
+        for name, payload in bad_sidecars.items():
+            with self.subTest(name):
+                with open(self.pipeline._resolved_cache_path, "wb") as f:
+                    f.write(payload)
+                self.assertEqual(self.pipeline._count_resolved(), expected)
+                # The rescan replaces the bad sidecar with a usable one
+                self.assertEqual(self.pipeline._load_scan_checkpoint()["resolved_count"], expected)
+
+    def test_in_place_resolve_rewrite(self):
+        records = [_record(i, False) for i in range(40)]
+        self._append(records)
+        self.assertCountMatches()
+
+        for i in (0, 3, 17):  # early records resolve and gain an outcome
+            records[i]["resolved"] = True
+            records[i]["outcome"] = {"pnl": 1.5, "exit_reason": "TP"}
+        self._rewrite(records)
+        self.assertCountMatches()
+
+    def test_truncation(self):
+        records = [_record(i, i % 2 == 0) for i in range(40)]
+        self._append(records)
+        self.assertCountMatches()
+
+        self._rewrite(records[:15])
+        self.assertCountMatches()
+
+        self._rewrite([])
+        self.assertEqual(self.pipeline._count_resolved(), 0)
+
+        self._append(records[:5])
+        self.assertCountMatches()
+
+    def test_partial_trailing_line(self):
+        self._append([_record(i, True) for i in range(5)])
+        last = (json.dumps(_record(5, True)) + "\n").encode("utf-8")
+        self._append([], partial=last[:20])
+        self.assertEqual(self.pipeline._count_resolved(), 5)
+
+        self._append([], partial=last[20:])
+        self.assertEqual(self.pipeline._count_resolved(), 6)
+        self.assertCountMatches()
+
+    def test_nested_resolved_keys(self):
+        records = [
+            _record(0, False, nested=True),
+            _record(1, True, nested=False),
+            _record(2, True, nested=True),
+            _record(3, False, nested=False),
+            _record(4, True),
+            {"id": "d5", "resolved": False, "metadata": {"resolved": True}, "notes": {"resolved": True}},
+        ]
+        self._append(records)
+        self.assertEqual(self.pipeline._count_resolved(), 3)
+        self.assertCountMatches()
+
+    def test_random_operations_match_brute_force(self):
+        for seed in range(10):
+            with self.subTest(seed=seed):
+                rng = random.Random(seed)
+                if os.path.exists(self.log_path):
+                    os.remove(self.log_path)
+                records = []
+                for step in range(25):
+                    op = rng.choice(("append", "append", "resolve", "truncate", "partial"))
+                    if op == "append" or not records:
+                        new = [_record(len(records) + j, rng.random() < 0.5,
+                                       nested=rng.choice((None, True, False)))
+                               for j in range(rng.randint(1, 8))]
+                        records.extend(new)
+                        self._append(new)
+                    elif op == "resolve":
+                        records[rng.randrange(len(records))].update(resolved=True, outcome={"pnl": rng.random()})
+                        self._rewrite(records)
+                    elif op == "truncate":
+                        del records[rng.randrange(len(records)):]
+                        self._rewrite(records)
+                    else:
+                        # Writer mid-line: count before the line is completed, then finish it
+                        rec = _record(len(records), True)
+                        line = (json.dumps(rec) + "\n").encode("utf-8")
+                        cut = rng.randrange(1, len(line) - 1)
+                        self._append([], partial=line[:cut])
+                        self.assertEqual(self.pipeline._count_resolved(), self._brute_force())
+                        self._append([], partial=line[cut:])
+                        records.append(rec)
+                    self.assertEqual(self.pipeline._count_resolved(), self._brute_force(), (seed, step, op))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,51 +1,84 @@
 import os
-import shutil
+import tempfile
 import unittest
+from dataclasses import dataclass
 
 from src.config import Config
 from src.core.portfolio import Portfolio
 
 
+def _fast_rmtree(path: str):
+    """rmtree over os.scandir entries; is_dir(follow_symlinks=False) reuses the d_type from the listing."""
+    try:
+        with os.scandir(path) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    _fast_rmtree(entry.path)
+                else:
+                    os.unlink(entry.path)
+        os.rmdir(path)
+    except FileNotFoundError:
+        pass
+
+
+@dataclass(slots=True)
+class _Fx:
+    orig_max_per_symbol: int
+    orig_max_concurrent: int
+    test_data_dir: str
+    state_path: str
+    portfolio: Portfolio
+
+
 class TestPortfolioMultiPosition(unittest.TestCase):
-    def setUp(self):
-        self._orig_max_per_symbol = Config.MAX_POSITIONS_PER_SYMBOL
-        self._orig_max_concurrent = Config.MAX_CONCURRENT_POSITIONS
+    @classmethod
+    def setUpClass(cls):
+        test_data_dir = tempfile.mkdtemp(prefix="portfolio_test_")
+        cls.fx = _Fx(
+            orig_max_per_symbol=Config.MAX_POSITIONS_PER_SYMBOL,
+            orig_max_concurrent=Config.MAX_CONCURRENT_POSITIONS,
+            test_data_dir=test_data_dir,
+            state_path=os.path.join(test_data_dir, "portfolio_state.json"),
+            portfolio=Portfolio(initial_balance=1000.0, load_state=False),
+        )
         Config.MAX_POSITIONS_PER_SYMBOL = 2
         Config.MAX_CONCURRENT_POSITIONS = 10
-        self.test_data_dir = "tests/data"
-        os.makedirs(self.test_data_dir, exist_ok=True)
-        self.state_path = os.path.join(self.test_data_dir, "portfolio_state.json")
-        if os.path.exists(self.state_path):
-            os.remove(self.state_path)
+        cls.fx.portfolio.refresh_limits()
+        cls.fx.portfolio.state_file = cls.fx.state_path
 
-        self.portfolio = Portfolio(initial_balance=1000.0, load_state=False)
-        self.portfolio.state_file = self.state_path
+    @classmethod
+    def tearDownClass(cls):
+        Config.MAX_POSITIONS_PER_SYMBOL = cls.fx.orig_max_per_symbol
+        Config.MAX_CONCURRENT_POSITIONS = cls.fx.orig_max_concurrent
+        _fast_rmtree(cls.fx.test_data_dir)
+
+    def setUp(self):
+        try:
+            os.remove(self.fx.state_path)
+        except FileNotFoundError:
+            pass
 
-    def tearDown(self):
-        Config.MAX_POSITIONS_PER_SYMBOL = self._orig_max_per_symbol
-        Config.MAX_CONCURRENT_POSITIONS = self._orig_max_concurrent
-        if os.path.exists(self.test_data_dir):
-            shutil.rmtree(self.test_data_dir)
+        self.fx.portfolio.reset(1000.0)
 
     def test_multi_positions_per_symbol(self):
-        opened1 = self.portfolio.open_position(
+        opened1 = self.fx.portfolio.open_position(
             "BTC/USDT", "LONG", 100.0, 100.0, 110.0, 90.0, "d1", leverage=1
         )
-        opened2 = self.portfolio.open_position(
+        opened2 = self.fx.portfolio.open_position(
             "BTC/USDT", "LONG", 101.0, 100.0, 111.0, 91.0, "d2", leverage=1
         )
         self.assertTrue(opened1)
         self.assertTrue(opened2)
-        self.assertEqual(self.portfolio.count_positions_for_symbol("BTC/USDT"), 2)
+        self.assertEqual(self.fx.portfolio.count_positions_for_symbol("BTC/USDT"), 2)
 
-        self.portfolio.update_metrics("BTC/USDT", 105.0)
-        closed = self.portfolio.close_position("BTC/USDT", 105.0, reason="TP", decision_id="d1")
+        self.fx.portfolio.update_metrics("BTC/USDT", 105.0)
+        closed = self.fx.portfolio.close_position("BTC/USDT", 105.0, reason="TP", decision_id="d1")
         self.assertIsNotNone(closed)
-        self.assertEqual(self.portfolio.count_positions_for_symbol("BTC/USDT"), 1)
+        self.assertEqual(self.fx.portfolio.count_positions_for_symbol("BTC/USDT"), 1)
 
-        closed2 = self.portfolio.close_position("BTC/USDT", 105.0, reason="TP")
+        closed2 = self.fx.portfolio.close_position("BTC/USDT", 105.0, reason="TP")
         self.assertIsNotNone(closed2)
-        self.assertEqual(self.portfolio.count_positions_for_symbol("BTC/USDT"), 0)
+        self.assertEqual(self.fx.portfolio.count_positions_for_symbol("BTC/USDT"), 0)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,96 @@
+import json
+import os
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+
+from src.ml.registry import ModelRegistry
+
+
+class TestModelRegistry(unittest.TestCase):
+    def setUp(self):
+        self.test_data_dir = tempfile.mkdtemp(prefix="registry_test_")
+        self.registry_path = os.path.join(self.test_data_dir, "registry.json")
+        self.registry = ModelRegistry(self.registry_path)
+
+    def tearDown(self):
+        shutil.rmtree(self.test_data_dir, ignore_errors=True)
+
+    def _on_disk(self):
+        with open(self.registry_path, "rb") as f:
+            return json.loads(f.read())
+
+    def _count_writes(self):
+        return mock.patch("src.ml.registry.os.replace", wraps=os.replace)
+
+    def test_mutation_outside_transaction_writes_immediately(self):
+        with self._count_writes() as replace:
+            self.registry.register_model("v1", "models/v1.pkl", {"test_roc_auc": 0.9}, 100)
+        self.assertEqual(replace.call_count, 1)
+        self.assertIn("v1", self._on_disk()["models"])
+        self.assertFalse(os.path.exists(self.registry_path + ".tmp"))
+
+    def test_nested_transactions_write_once(self):
+        with self._count_writes() as replace:
+            with self.registry.transaction():
+                self.registry.register_model("v1", "models/v1.pkl", {"test_roc_auc": 0.9}, 100)
+                with self.registry.transaction():
+                    self.registry.register_model("v2", "models/v2.pkl", {"test_roc_auc": 0.95}, 200)
+                    self.registry.promote_model("v2", 200)
+                self.assertEqual(replace.call_count, 0)
+                self.assertEqual(self._on_disk()["models"], {})
+        self.assertEqual(replace.call_count, 1)
+        on_disk = self._on_disk()
+        self.assertEqual(set(on_disk["models"]), {"v1", "v2"})
+        self.assertEqual(on_disk["active_version"], "v2")
+
+    def test_unchanged_data_skips_write(self):
+        self.registry.register_model("v1", "models/v1.pkl", {"test_roc_auc": 0.9}, 100)
+        with self._count_writes() as replace:
+            self.registry._save()
+            with self.registry.transaction():
+                pass
+        self.assertEqual(replace.call_count, 0)
+
+    def test_exception_in_transaction_discards_batch(self):
+        self.registry.register_model("v1", "models/v1.pkl", {"test_roc_auc": 0.9}, 100)
+        self.registry.promote_model("v1", 100)
+        before = self._on_disk()
+
+        with self._count_writes() as replace:
+            with self.assertRaises(RuntimeError):
+                with self.registry.transaction():
+                    self.registry.register_model("v2", "models/v2.pkl", {"test_roc_auc": 0.95}, 200)
+                    raise RuntimeError("evaluation failed before promote")
+        self.assertEqual(replace.call_count, 0)
+        self.assertEqual(self._on_disk(), before)
+        self.assertEqual(self.registry.data, before)
+
+        # The registry stays usable after the aborted batch
+        with self.registry.transaction():
+            self.registry.register_model("v2", "models/v2.pkl", {"test_roc_auc": 0.95}, 200)
+        self.assertIn("v2", self._on_disk()["models"])
+
+    def test_failed_write_leaves_previous_file(self):
+        self.registry.register_model("v1", "models/v1.pkl", {"test_roc_auc": 0.9}, 100)
+        with open(self.registry_path, "rb") as f:
+            before = f.read()
+
+        with mock.patch("src.ml.registry.os.replace", side_effect=OSError("disk full")):
+            with self.assertRaises(OSError):
+                self.registry.register_model("v2", "models/v2.pkl", {"test_roc_auc": 0.95}, 200)
+        with open(self.registry_path, "rb") as f:
+            self.assertEqual(f.read(), before)
+
+    def test_reload_reads_saved_registry(self):
+        with self.registry.transaction():
+            self.registry.register_model("v1", "models/v1.pkl", {"test_roc_auc": 0.9}, 100)
+            self.registry.promote_model("v1", 100)
+        reloaded = ModelRegistry(self.registry_path)
+        self.assertEqual(reloaded.data, self.registry.data)
+        self.assertEqual(reloaded.get_active_model_path(), "models/v1.pkl")
+
+
+if __name__ == "__main__":
+    unittest.main()
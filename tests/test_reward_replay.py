@@ -5,152 +5,52 @@ Covers issue #16 from code review.
 
 import unittest
 from src.core.reward import RewardCalculator
-from src.core.definitions import MarketState, MarketRegime, VolatilityLevel, TrendStrength
+
+_calc = RewardCalculator.calculate_final_reward
+
+# (name, exit_reason, realized_pnl, duration_candles, is_wait_action,
+#  market_change_during_wait, repetition_count, expected)
+REWARD_CASES = [
+    # TP within 5 candles gets +0.5 bonus: 1.5 + 0.5 = 2.0
+    ("tp_quick_exit_bonus", "TP", 1.5, 3, False, 0.0, 0, 2.0),
+    # TP after 5+ candles gets no bonus
+    ("tp_slow_exit_no_bonus", "TP", 1.5, 10, False, 0.0, 0, 1.5),
+    # TIME_EXIT (and legacy TIME) apply -0.1 penalty: 0.5 - 0.1 = 0.4
+    ("time_exit_penalty", "TIME_EXIT", 0.5, 50, False, 0.0, 0, 0.4),
+    ("time_exit_legacy_format", "TIME", 0.5, 50, False, 0.0, 0, 0.4),
+    # SL just captures the PnL loss, no extra penalty
+    ("sl_exit_no_extra_penalty", "SL", -1.0, 5, False, 0.0, 0, -1.0),
+    # WAIT during a 2.5% crash is rewarded
+    ("wait_action_market_crash", "", 0, 0, True, -2.5, 0, 1.0),
+    # WAIT during a 3% pump is a missed opportunity
+    ("wait_action_missed_pump", "", 0, 0, True, 3.0, 0, -0.5),
+    # WAIT in a flat market: patience in noise
+    ("wait_action_neutral_market", "", 0, 0, True, 0.5, 0, 0.05),
+    # Diminishing returns: 100% / 80% / 50% / 20% (repeats >= 3)
+    ("diminishing_returns_first_execution", "TP", 1.0, 10, False, 0.0, 0, 1.0),
+    ("diminishing_returns_second_execution", "TP", 1.0, 10, False, 0.0, 1, 0.8),
+    ("diminishing_returns_third_execution", "TP", 1.0, 10, False, 0.0, 2, 0.5),
+    ("diminishing_returns_many_executions", "TP", 1.0, 10, False, 0.0, 5, 0.2),
+    # Losses are never diminished
+    ("no_diminishing_on_losses", "SL", -2.0, 10, False, 0.0, 5, -2.0),
+]
 
 
 class TestRewardCalculator(unittest.TestCase):
     """Tests for RewardCalculator"""
-    
-    def test_tp_quick_exit_bonus(self):
-        """TP within 5 candles should get +0.5 bonus"""
-        reward = RewardCalculator.calculate_final_reward(
-            exit_reason="TP",
-            realized_pnl=1.5,
-            duration_candles=3,  # Quick exit
-        )
-        # 1.5 base + 0.5 bonus = 2.0
-        self.assertEqual(reward, 2.0)
-    
-    def test_tp_slow_exit_no_bonus(self):
-        """TP after 5+ candles should NOT get bonus"""
-        reward = RewardCalculator.calculate_final_reward(
-            exit_reason="TP",
-            realized_pnl=1.5,
-            duration_candles=10,  # Slow exit
-        )
-        # 1.5 base, no bonus
-        self.assertEqual(reward, 1.5)
-    
-    def test_time_exit_penalty(self):
-        """TIME_EXIT should apply -0.1 penalty"""
-        reward = RewardCalculator.calculate_final_reward(
-            exit_reason="TIME_EXIT",
-            realized_pnl=0.5,
-            duration_candles=50,
-        )
-        # 0.5 - 0.1 = 0.4
-        self.assertEqual(reward, 0.4)
-    
-    def test_time_exit_legacy_format(self):
-        """TIME (legacy format) should also apply penalty"""
-        reward = RewardCalculator.calculate_final_reward(
-            exit_reason="TIME",
-            realized_pnl=0.5,
-            duration_candles=50,
-        )
-        # 0.5 - 0.1 = 0.4
-        self.assertEqual(reward, 0.4)
-    
-    def test_sl_exit_no_extra_penalty(self):
-        """SL exit should just capture PnL loss, no extra penalty"""
-        reward = RewardCalculator.calculate_final_reward(
-            exit_reason="SL",
-            realized_pnl=-1.0,
-            duration_candles=5,
-        )
-        # -1.0 (no extra penalty)
-        self.assertEqual(reward, -1.0)
-    
-    def test_wait_action_market_crash(self):
-        """Waiting during market crash should be rewarded"""
-        reward = RewardCalculator.calculate_final_reward(
-            exit_reason="",
-            realized_pnl=0,
-            duration_candles=0,
-            is_wait_action=True,
-            market_change_during_wait=-2.5,  # Market crashed 2.5%
-        )
-        # Good wait = +1.0
-        self.assertEqual(reward, 1.0)
-    
-    def test_wait_action_missed_pump(self):
-        """Waiting during pump should be penalized"""
-        reward = RewardCalculator.calculate_final_reward(
-            exit_reason="",
-            realized_pnl=0,
-            duration_candles=0,
-            is_wait_action=True,
-            market_change_during_wait=3.0,  # Market pumped 3%
-        )
-        # Missed opportunity = -0.5
-        self.assertEqual(reward, -0.5)
-    
-    def test_wait_action_neutral_market(self):
-        """Waiting during flat market should get small reward"""
-        reward = RewardCalculator.calculate_final_reward(
-            exit_reason="",
-            realized_pnl=0,
-            duration_candles=0,
-            is_wait_action=True,
-            market_change_during_wait=0.5,  # Flat
-        )
-        # Patience in noise = +0.05
-        self.assertEqual(reward, 0.05)
-    
-    def test_diminishing_returns_first_execution(self):
-        """First execution (repeats=0) gets full reward"""
-        reward = RewardCalculator.calculate_final_reward(
-            exit_reason="TP",
-            realized_pnl=1.0,
-            duration_candles=10,
-            repetition_count=0,
-        )
-        # 1.0 * 1.0 = 1.0
-        self.assertEqual(reward, 1.0)
-    
-    def test_diminishing_returns_second_execution(self):
-        """Second execution (repeats=1) gets 80% reward"""
-        reward = RewardCalculator.calculate_final_reward(
-            exit_reason="TP",
-            realized_pnl=1.0,
-            duration_candles=10,
-            repetition_count=1,
-        )
-        # 1.0 * 0.8 = 0.8
-        self.assertEqual(reward, 0.8)
-    
-    def test_diminishing_returns_third_execution(self):
-        """Third execution (repeats=2) gets 50% reward"""
-        reward = RewardCalculator.calculate_final_reward(
-            exit_reason="TP",
-            realized_pnl=1.0,
-            duration_candles=10,
-            repetition_count=2,
-        )
-        # 1.0 * 0.5 = 0.5
-        self.assertEqual(reward, 0.5)
-    
-    def test_diminishing_returns_many_executions(self):
-        """4+ executions (repeats>=3) gets 20% reward"""
-        reward = RewardCalculator.calculate_final_reward(
-            exit_reason="TP",
-            realized_pnl=1.0,
-            duration_candles=10,
-            repetition_count=5,
-        )
-        # 1.0 * 0.2 = 0.2
-        self.assertEqual(reward, 0.2)
-    
-    def test_no_diminishing_on_losses(self):
-        """Losses should NOT be diminished (full penalty)"""
-        reward = RewardCalculator.calculate_final_reward(
-            exit_reason="SL",
-            realized_pnl=-2.0,
-            duration_candles=10,
-            repetition_count=5,  # Many repeats
-        )
-        # -2.0 (unchanged, losses not diminished)
-        self.assertEqual(reward, -2.0)
+
+    def test_reward(self):
+        for name, reason, pnl, duration, is_wait, market_change, repeats, expected in REWARD_CASES:
+            with self.subTest(name):
+                reward = _calc(
+                    exit_reason=reason,
+                    realized_pnl=pnl,
+                    duration_candles=duration,
+                    is_wait_action=is_wait,
+                    market_change_during_wait=market_change,
+                    repetition_count=repeats,
+                )
+                self.assertAlmostEqual(reward, expected, places=9)
 
 
 if __name__ == '__main__':
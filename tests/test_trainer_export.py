@@ -0,0 +1,61 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+import numpy as np
+import pandas as pd
+import xgboost as xgb
+
+from src.ml.inference import _load_artifact
+from src.ml.trainer import PolicyTrainer
+
+
+def _frame(trainer, n, seed):
+    rng = np.random.default_rng(seed)
+    df = pd.DataFrame(rng.normal(size=(n, len(trainer.feature_cols))), columns=trainer.feature_cols)
+    df[trainer.target_col] = (df["macd"] + rng.normal(scale=0.5, size=n) > 0).astype(int)
+    return df
+
+
+class TestBoosterExport(unittest.TestCase):
+    def setUp(self):
+        self.test_data_dir = tempfile.mkdtemp(prefix="trainer_test_")
+        self.trainer = PolicyTrainer(n_estimators=10, max_depth=3, random_state=42)
+        self.trainer.train(_frame(self.trainer, 200, 0), _frame(self.trainer, 80, 1))
+
+    def tearDown(self):
+        shutil.rmtree(self.test_data_dir, ignore_errors=True)
+
+    def test_save_model_skips_booster_by_default(self):
+        path = os.path.join(self.test_data_dir, "policy_model_v1.pkl")
+        self.trainer.save_model(path)
+        self.assertTrue(os.path.exists(path))
+        self.assertFalse(os.path.exists(os.path.join(self.test_data_dir, "policy_model_v1.json")))
+
+    def test_save_model_exports_booster_next_to_pickle(self):
+        path = os.path.join(self.test_data_dir, "policy_model_v1.pkl")
+        self.trainer.save_model(path, export_booster=True)
+        booster_path = os.path.join(self.test_data_dir, "policy_model_v1.json")
+        self.assertTrue(os.path.exists(booster_path))
+
+        booster = _load_artifact(booster_path)
+        self.assertIsInstance(booster, xgb.Booster)
+        X = _frame(self.trainer, 20, 2)[self.trainer.feature_cols].astype(np.float32)
+        np.testing.assert_allclose(
+            booster.predict(xgb.DMatrix(X)),
+            self.trainer.model.predict_proba(X)[:, 1],
+            rtol=1e-6,
+        )
+
+    def test_bare_filename_saves_to_cwd(self):
+        cwd = os.getcwd()
+        os.chdir(self.test_data_dir)
+        self.addCleanup(os.chdir, cwd)
+        self.trainer.save_model("model.pkl", export_booster=True)
+        self.assertTrue(os.path.exists("model.pkl"))
+        self.assertTrue(os.path.exists("model.json"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,41 @@
+import os
+import unittest
+from unittest import mock
+
+import numpy as np
+import optuna
+import pandas as pd
+
+from src.ml.trainer import PolicyTrainer
+
+
+def _frame(trainer, n, seed):
+    rng = np.random.default_rng(seed)
+    df = pd.DataFrame(rng.normal(size=(n, len(trainer.feature_cols))), columns=trainer.feature_cols)
+    df[trainer.target_col] = (df["macd"] + rng.normal(scale=0.5, size=n) > 0).astype(int)
+    return df
+
+
+class TestOptimizeParallelism(unittest.TestCase):
+    def setUp(self):
+        optuna.logging.set_verbosity(optuna.logging.WARNING)
+
+    def _trial_concurrency(self, trainer, **kwargs):
+        with mock.patch.object(optuna.Study, "optimize", autospec=True,
+                               side_effect=optuna.Study.optimize) as study_optimize:
+            trainer.optimize(_frame(trainer, 120, 0), _frame(trainer, 60, 1), n_trials=2, **kwargs)
+        return study_optimize.call_args.kwargs["n_jobs"]
+
+    def test_model_thread_cap_does_not_serialize_trials(self):
+        trainer = PolicyTrainer(n_jobs=1)
+        self.assertEqual(self._trial_concurrency(trainer), os.cpu_count() or 1)
+        self.assertEqual(trainer.params["n_jobs"], 1)
+
+    def test_explicit_trial_concurrency(self):
+        trainer = PolicyTrainer(n_jobs=4)
+        self.assertEqual(self._trial_concurrency(trainer, n_parallel_trials=2), 2)
+        self.assertEqual(trainer.params["n_jobs"], 4)
+
+
+if __name__ == "__main__":
+    unittest.main()
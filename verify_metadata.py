@@ -1,30 +1,78 @@
 import json
+import mmap
 import os
+import sys
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 LOG_FILE = 'data/experience_log.jsonl'
 
+
+def _loads(line: bytes):
+    """orjson first; stdlib json for the NaN/Infinity tokens json.dumps can emit."""
+    if orjson is not None:
+        try:
+            return orjson.loads(line)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(line)
+
+
+def _count_records(f) -> int:
+    """Line count via C-level bytes.count over 1 MiB blocks (no per-line objects)."""
+    count = 0
+    last = b""
+    while True:
+        chunk = f.read(1 << 20)
+        if not chunk:
+            break
+        count += chunk.count(b"\n")
+        last = chunk
+    if last and not last.endswith(b"\n"):
+        count += 1  # unterminated final record
+    return count
+
+
+# Diagnostics (record count, last-5 dump) cost a full scan / extra parses: opt-in only
+verbose = "-v" in sys.argv or bool(os.environ.get("VERIFY_VERBOSE"))
+
 if not os.path.exists(LOG_FILE):
     print("Log file not found.")
     exit(1)
 
-with open(LOG_FILE, 'r') as f:
-    lines = f.readlines()
-    if not lines:
-        print("Log file empty.")
-        exit(1)
-        
-    print(f"Total Records: {len(lines)}")
-    for line in lines[-5:]:
-        try:
-            record = json.loads(line)
-            symbol = record['market_state'].get('symbol', 'UNKNOWN')
-            period = record['metadata'].get('market_period_id', 'UNKNOWN')
-            print(f"ID: {record.get('id')} | Symbol: {symbol} | Period: {period}")
-        except:
-            print("Error parsing line")
+if os.path.getsize(LOG_FILE) == 0:
+    print("Log file empty.")
+    exit(1)
+
+with open(LOG_FILE, 'rb') as f:
+    # Only the last 5 records are inspected: walk back from EOF over the mapped file,
+    # so only the tail pages are touched
+    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        end = len(mm)
+        pos = end - 1 if mm[-1:] == b"\n" else end  # ignore the trailing newline
+        for _ in range(5):
+            pos = mm.rfind(b"\n", 0, pos)
+            if pos < 0:
+                break
+        lines = mm[pos + 1:end].splitlines()
+
+    # The verdict below needs just the last record
+    if verbose:
+        print(f"Total Records: {_count_records(f)}")
+        for line in lines:
+            try:
+                record = _loads(line)
+                symbol = record['market_state'].get('symbol', 'UNKNOWN')
+                period = record['metadata'].get('market_period_id', 'UNKNOWN')
+                print(f"ID: {record.get('id')} | Symbol: {symbol} | Period: {period}")
+            except (json.JSONDecodeError, KeyError) as e:
+                print(f"Error parsing line: {e}")
 
     # Check last one specifically for success condition
-    last_record = json.loads(lines[-1])
+    last_record = _loads(lines[-1])
     symbol = last_record['market_state'].get('symbol', 'UNKNOWN')
     period = last_record['metadata'].get('market_period_id', 'UNKNOWN')
     